@@ -20,7 +20,7 @@ from collector import (
     fetch_products,
     calculate_central_date,
 )
-from downloader import download_product
+from downloader import download_products
 
 try:
     from coverage_optimizer import select_covering_products, CoverageResult
@@ -106,6 +106,7 @@ def auto_select_products(
     solver_timeout: int = 300,
     coverage_cloud_weight: float = 0.3,
     coverage_quality_weight: float = 0.7,
+    coverage_cache_dir: Optional[str] = None,
 ) -> list[dict[str, Any]]:
     """
     Automatically select products based on a strategy.
@@ -210,6 +211,7 @@ def auto_select_products(
                 solver_timeout=solver_timeout,
                 cloud_weight=coverage_cloud_weight,
                 quality_weight=coverage_quality_weight,
+                cache_dir=coverage_cache_dir,
             )
             
             # Extract selected products by indices
@@ -278,6 +280,8 @@ def run_collection(
     solver_timeout: int = 300,
     coverage_cloud_weight: float = 0.3,
     coverage_quality_weight: float = 0.7,
+    coverage_cache_dir: Optional[str] = None,
+    parallel_downloads: int = 4,
 ) -> CollectionResult:
     """
     Run a satellite image collection programmatically.
@@ -299,6 +303,9 @@ def run_collection(
         aoi_weight: Weight for AOI coverage in quality score
         cloud_weight: Weight for cloud cover in quality score
         recency_weight: Weight for date recency in quality score
+        coverage_cache_dir: Directory caching coverage rows between runs
+            (coverage strategies only; None disables the cache)
+        parallel_downloads: Maximum number of products downloaded concurrently
         
     Returns:
         CollectionResult with success status and details
@@ -493,6 +500,7 @@ def run_collection(
             solver_timeout=solver_timeout,
             coverage_cloud_weight=coverage_cloud_weight,
             coverage_quality_weight=coverage_quality_weight,
+            coverage_cache_dir=coverage_cache_dir,
         )
         
         if not selected_products:
@@ -506,10 +514,9 @@ def run_collection(
             )
         
         # Download selected products
+        pending_products = []
         for product in selected_products:
             product_name = product["Name"]
-            product_id = product["Id"]
-            cloud_cover = product.get("cloud_cover_float")
             
             # Check if already downloaded
             if check_already_downloaded(product_name, output_dir):
@@ -517,16 +524,28 @@ def run_collection(
                 downloaded_products.append(product_name)
                 continue
             
-            # Download product
+            pending_products.append(product)
+        
+        if pending_products:
+            console.print(
+                f"[cyan]Downloading {len(pending_products)} products "
+                f"({min(parallel_downloads, len(pending_products))} in parallel)...[/cyan]"
+            )
+        download_errors = download_products(
+            [(product["Id"], product["Name"]) for product in pending_products],
+            access_token=access_token,
+            output_dir=output_dir,
+            max_workers=parallel_downloads,
+        )
+        
+        for product in pending_products:
+            product_name = product["Name"]
+            product_id = product["Id"]
+            cloud_cover = product.get("cloud_cover_float")
+            
             try:
-                console.print(f"[cyan]Downloading {product_name}...[/cyan]")
-                download_product(
-                    product_id,
-                    product_name=product_name,
-                    access_token=access_token,
-                    output_dir=output_dir,
-                    node_path=None,
-                )
+                if download_errors.get(product_name) is not None:
+                    raise download_errors[product_name]
                 
                 # Save metadata
                 safe_dir_path = pathlib.Path(output_dir) / product_name
@@ -6,6 +6,7 @@ including schedule definitions, collection job parameters, and configuration loa
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -238,18 +239,37 @@ class CollectionJobConfig:
     auto_select: AutoSelectConfig
     output_dir: str
     enabled: bool = True
+    parallel_downloads: int = 4  # Max products downloaded concurrently
+    coverage_cache_dir: Optional[str] = None  # Reuse coverage rows across runs (coverage_* strategies)
+    
+    @cached_property
+    def resolved_aoi_path(self) -> Path:
+        """AOI path with ~ expanded and made absolute, computed once per job."""
+        return Path(self.aoi_path).expanduser().resolve()
+    
+    @cached_property
+    def resolved_output_dir(self) -> Path:
+        """Output directory with ~ expanded and made absolute, computed once per job."""
+        return Path(self.output_dir).expanduser().resolve()
+    
+    @cached_property
+    def resolved_coverage_cache_dir(self) -> Optional[Path]:
+        """Coverage cache directory with ~ expanded and made absolute, or None if unset."""
+        if self.coverage_cache_dir is None:
+            return None
+        return Path(self.coverage_cache_dir).expanduser().resolve()
     
     def __post_init__(self):
         """Validate collection job configuration."""
         # Validate AOI file exists
-        aoi_path = Path(self.aoi_path).expanduser()
+        aoi_path = self.resolved_aoi_path
         if not aoi_path.exists():
             raise ValueError(f"AOI file not found: {self.aoi_path}")
         if not aoi_path.suffix.lower() == ".geojson":
             raise ValueError(f"AOI file must be .geojson, got {aoi_path.suffix}")
         
         # Validate output directory is writable
-        output_path = Path(self.output_dir).expanduser()
+        output_path = self.resolved_output_dir
         try:
             output_path.mkdir(parents=True, exist_ok=True)
         except Exception as e:
@@ -258,6 +278,9 @@ class CollectionJobConfig:
         # Validate name is a valid identifier
         if not re.match(r'^[a-zA-Z0-9_-]+$', self.name):
             raise ValueError(f"Job name must contain only letters, numbers, underscores, and hyphens: {self.name}")
+        
+        if self.parallel_downloads <= 0:
+            raise ValueError(f"parallel_downloads must be positive, got {self.parallel_downloads}")
 
 
 @dataclass
@@ -331,7 +354,9 @@ def load_config(config_path: str) -> SchedulerConfig:
                 filters=filters,
                 auto_select=auto_select,
                 output_dir=job_data['output_dir'],
-                enabled=job_data.get('enabled', True)
+                enabled=job_data.get('enabled', True),
+                parallel_downloads=job_data.get('parallel_downloads', 4),
+                coverage_cache_dir=job_data.get('coverage_cache_dir')
             )
             jobs.append(job)
         except KeyError as e:
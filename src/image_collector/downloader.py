@@ -1,9 +1,25 @@
+import contextlib
+import ctypes
+import io
 import logging
 import os
+import re
+import shutil
+import struct
+import sys
+import threading
 import zipfile
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
+from rich.text import Text
 from rich.progress import (
     BarColumn,
     Progress,
@@ -14,7 +30,63 @@ from rich.progress import (
 
 console = Console()
 logger = logging.getLogger(__name__)
+# Scheduled/daemon runs write to a file or pipe: skip live rendering and just log
+_IS_TTY = console.is_terminal
+_EMOJI_CODE = re.compile(r":[a-z0-9_+-]+: ?")
 ODATA_DOWNLOAD_BASE_URL = "https://download.dataspace.copernicus.eu/odata/v1"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+PROGRESS_UPDATE_BYTES = 512 * 1024
+EXTRACT_COPY_BUFFER_SIZE = 1024 * 1024
+ZIP_READ_BUFFER_SIZE = 1024 * 1024
+EXTRACT_MAX_WORKERS = 8
+# sendfile() into a regular file is only supported by Linux
+ZERO_COPY_EXTRACT = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+# Retry transient gateway errors; the last response still goes through raise_for_status
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD"]),
+    raise_on_status=False,
+)
+
+
+def _new_session(pool_connections: int, pool_maxsize: int) -> requests.Session:
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=HTTP_RETRY,
+        ),
+    )
+    return session
+
+
+# Shared session: keeps TCP/TLS connections to the CDSE hosts alive between requests
+_SESSION = _new_session(pool_connections=8, pool_maxsize=16)
+
+# (product_id, node_path) -> (etag, nodes); lets repeated listings be answered with a 304
+NODE_CACHE_MAX_ENTRIES = 1024
+_NODE_CACHE: OrderedDict[tuple[str, str], tuple[str, list]] = OrderedDict()
+_NODE_CACHE_LOCK = threading.Lock()
+
+
+def _cached_nodes(key: tuple[str, str]) -> tuple[str, list] | None:
+    with _NODE_CACHE_LOCK:
+        entry = _NODE_CACHE.get(key)
+        if entry is not None:
+            _NODE_CACHE.move_to_end(key)
+        return entry
+
+
+def _store_nodes(key: tuple[str, str], etag: str, nodes: list):
+    with _NODE_CACHE_LOCK:
+        _NODE_CACHE[key] = (etag, nodes)
+        _NODE_CACHE.move_to_end(key)
+        if len(_NODE_CACHE) > NODE_CACHE_MAX_ENTRIES:
+            _NODE_CACHE.popitem(last=False)
 
 
 def list_product_nodes(
@@ -30,13 +102,25 @@ def list_product_nodes(
         nodes_url = f"{ODATA_DOWNLOAD_BASE_URL}/Products({product_id})/Nodes"
     logger.info(f"Listing nodes for product {product_id} at path '{node_path or '/'}'.")
     logger.debug(f"Node listing URL: {nodes_url}")
+    cache_key = (product_id, node_path)
+    cached = _cached_nodes(cache_key)
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
     try:
-        response = requests.get(nodes_url, headers=headers, timeout=60)
+        response = _SESSION.get(nodes_url, headers=headers, timeout=60)
+        if response.status_code == 304 and cached is not None:
+            logger.info(f"Node listing at path '{node_path or '/'}' unchanged; using cache.")
+            return list(cached[1])
         response.raise_for_status()
         data = response.json()
         nodes = data.get("value", data.get("result", []))
         logger.info(f"Found {len(nodes)} nodes at path '{node_path or '/'}'.")
-        return nodes if isinstance(nodes, list) else []
+        nodes = nodes if isinstance(nodes, list) else []
+        etag = response.headers.get("ETag")
+        if etag:
+            _store_nodes(cache_key, etag, nodes)
+            return list(nodes)
+        return nodes
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
             logger.warning(
@@ -62,26 +146,120 @@ def list_product_nodes(
         return None
 
 
+def _notify(message: str, level: int | None = logging.INFO):
+    """Print a Rich message on a terminal, otherwise log it as plain text.
+
+    level=None marks messages whose details were already logged by the caller.
+    """
+    if _IS_TTY:
+        console.print(message)
+    elif level is not None:
+        plain = Text.from_markup(message, emoji=False).plain
+        logger.log(level, _EMOJI_CODE.sub("", plain))
+
+
+def _new_download_progress() -> Progress:
+    return Progress(
+        TextColumn("[bold blue]{task.description}", justify="right"),
+        BarColumn(bar_width=None),
+        "[progress.percentage]{task.percentage:>3.1f}%",
+        "•",
+        TransferSpeedColumn(),
+        "•",
+        TimeElapsedColumn(),
+        console=console,
+        disable=not _IS_TTY,
+        refresh_per_second=4,
+    )
+
+
+def _stream_to_file(response: requests.Response, f, progress: Progress, task_id):
+    # Hot loop: bind methods to locals and take the byte count from write()
+    write = f.write
+    advance = progress.update
+    written_since_update = 0
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        if chunk:
+            written_since_update += write(chunk)
+            if written_since_update >= PROGRESS_UPDATE_BYTES:
+                advance(task_id, advance=written_since_update)
+                written_since_update = 0
+    advance(task_id, advance=written_since_update)
+
+
+# fallocate(2) mode flag: reserve blocks without changing the file size
+_FALLOC_FL_KEEP_SIZE = 0x01
+
+
+@lru_cache(maxsize=1)
+def _libc_fallocate():
+    # os.posix_fallocate always extends st_size, so call fallocate(2) directly
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fallocate = getattr(libc, "fallocate64", None) or libc.fallocate
+    except (OSError, AttributeError):
+        return None
+    fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    fallocate.restype = ctypes.c_int
+    return fallocate
+
+
+def _preallocate(f, offset: int, total_size: int):
+    # Reserve the remaining extent in one call instead of growing it chunk by
+    # chunk. KEEP_SIZE leaves st_size at the bytes written, so the .part size
+    # stays a valid resume offset even if the process is killed mid-download.
+    if total_size <= offset:
+        return
+    fallocate = _libc_fallocate()
+    if fallocate is None:
+        return
+    if fallocate(f.fileno(), _FALLOC_FL_KEEP_SIZE, offset, total_size - offset) != 0:
+        error = ctypes.get_errno()
+        logger.debug(
+            f"Could not preallocate {total_size} bytes for {f.name}: {os.strerror(error)}"
+        )
+
+
+def _remote_content_length(
+    http: requests.Session, url: str, headers: dict
+) -> int | None:
+    try:
+        response = http.head(url, headers=headers, allow_redirects=True, timeout=30)
+        response.raise_for_status()
+        content_length = response.headers.get("content-length")
+        return int(content_length) if content_length else None
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.warning(f"HEAD request for {url} failed: {e}")
+        return None
+
+
 def download_product(
     product_id: str,
     product_name: str,
     access_token: str,
     output_dir: str = ".",
     node_path: str | None = None,
-):
+    session: requests.Session | None = None,
+    progress: Progress | None = None,
+) -> bool:
+    """Download and extract one product; returns True once its SAFE directory exists."""
     if not product_id or not access_token:
         logger.error("Product ID and Access Token are required for download.")
-        return
+        return False
     headers = {
         "Authorization": f"Bearer {access_token}",
     }
     download_url = f"{ODATA_DOWNLOAD_BASE_URL}/Products({product_id})/$value"
-    output_filename = f"{product_name}.zip"
-    output_path = os.path.join(output_dir, output_filename)
-    extract_path = os.path.splitext(output_path)[0]
+    output_path = Path(output_dir) / f"{product_name}.zip"
+    extract_path = output_path.with_suffix("")
+    # Path components used by the status messages below, split out once
+    zip_name = output_path.name
     if node_path:
-        console.print(
-            "[yellow]Warning: Node-specific download logic currently disabled in this modification.[/]"
+        _notify(
+            "[yellow]Warning: Node-specific download logic currently disabled in this modification.[/]",
+            level=None,
         )
         logger.warning(
             "Node path provided but logic focuses on full zip download/unzip."
@@ -94,129 +272,318 @@ def download_product(
     logger.info(f"Checking for product: {product_name}")
     logger.info(f"Expected Zip Path: {output_path}")
     logger.info(f"Expected Extract Path: {extract_path}")
-    if os.path.isdir(extract_path):
-        console.print(
-            f":white_check_mark: [green]Product '{os.path.basename(extract_path)}' already extracted. Skipping.[/]"
-        )
-        return
-    if os.path.exists(output_path):
-        console.print(
-            f":file_folder: Found existing archive [cyan]'{os.path.basename(output_path)}'[/]. Attempting to unzip..."
+    if extract_path.is_dir():
+        _notify(
+            f":white_check_mark: [green]Product '{extract_path.name}' already extracted. Skipping.[/]"
         )
-        if _unzip_and_remove(output_path, extract_path):
-            return
-        else:
-            console.print(
-                ":warning: [yellow]Failed to unzip existing archive. Will download a fresh copy.[/]"
+        return True
+    http = session if session is not None else _SESSION
+    # Stream into a .part file and resume it with a Range request on the next attempt
+    part_path = output_path.with_name(f"{zip_name}.part")
+    if output_path.exists():
+        local_size = output_path.stat().st_size
+        remote_size = _remote_content_length(http, download_url, headers)
+        if remote_size is not None and local_size < remote_size:
+            # Truncated archive: continue it instead of unzipping a file that cannot be read
+            _notify(
+                f":file_folder: Found incomplete archive [cyan]'{zip_name}'[/] ({local_size}/{remote_size} bytes). Resuming download..."
+            )
+            os.replace(output_path, part_path)
+        elif remote_size is not None and local_size > remote_size:
+            _notify(
+                ":warning: [yellow]Existing archive is larger than the remote product. Will download a fresh copy.[/]",
+                level=logging.WARNING,
             )
             _cleanup_incomplete_file(output_path)
+        else:
+            _notify(
+                f":file_folder: Found existing archive [cyan]'{zip_name}'[/]. Attempting to unzip..."
+            )
+            if _unzip_and_remove(output_path, extract_path):
+                return True
+            else:
+                _notify(
+                    ":warning: [yellow]Failed to unzip existing archive. Will download a fresh copy.[/]",
+                    level=logging.WARNING,
+                )
+                _cleanup_incomplete_file(output_path)
     logger.info(f"Proceeding to download: {download_target_description}")
+    resume_from = part_path.stat().st_size if part_path.exists() else 0
+    request_headers = dict(headers)
+    if resume_from > 0:
+        request_headers["Range"] = f"bytes={resume_from}-"
     try:
-        console.print(
-            f":arrow_down: Downloading [cyan]{os.path.basename(output_path)}[/]..."
-        )
-        with requests.get(
+        if resume_from > 0:
+            _notify(
+                f":arrow_down: Resuming [cyan]{zip_name}[/] from {resume_from} bytes..."
+            )
+        else:
+            _notify(
+                f":arrow_down: Downloading [cyan]{zip_name}[/]..."
+            )
+        with http.get(
             download_url,
-            headers=headers,
+            headers=request_headers,
             stream=True,
             allow_redirects=True,
             timeout=120,
         ) as r:
+            if r.status_code == 416:
+                # The partial file no longer matches the remote product
+                _cleanup_incomplete_file(part_path)
             r.raise_for_status()
+            if r.status_code != 206:
+                # Server ignored the Range header and is sending the whole product
+                resume_from = 0
             total_size = int(r.headers.get("content-length", 0))
-            block_size = 8192
-            progress = Progress(
-                TextColumn("[bold blue]{task.description}", justify="right"),
-                BarColumn(bar_width=None),
-                "[progress.percentage]{task.percentage:>3.1f}%",
-                "•",
-                TransferSpeedColumn(),
-                "•",
-                TimeElapsedColumn(),
-            )
+            if total_size != 0:
+                total_size += resume_from
+            # A caller-provided progress is already live and shared with other downloads
+            own_progress = progress is None
+            if own_progress:
+                progress = _new_download_progress()
             task_id = progress.add_task(
-                f"Downloading {os.path.basename(output_path)}...", total=total_size
+                f"Downloading {zip_name}...",
+                total=total_size,
+                completed=resume_from,
             )
-            with progress:
-                with open(output_path, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=block_size):
-                        if chunk:
-                            f.write(chunk)
-                            progress.update(task_id, advance=len(chunk))
-            final_size = os.path.getsize(output_path)
+            with progress if own_progress else contextlib.nullcontext():
+                with open(part_path, "r+b" if resume_from > 0 else "wb") as f:
+                    f.seek(resume_from)
+                    _preallocate(f, resume_from, total_size)
+                    _stream_to_file(r, f, progress, task_id)
+            final_size = part_path.stat().st_size
             if final_size != total_size and total_size != 0:
-                console.print(
-                    f":x: [bold red]Error: Final size ({final_size}) doesn't match expected ({total_size}). Download may be corrupt.[/]"
-                )
-            else:
-                console.print(
-                    f":white_check_mark: [bold green]Successfully downloaded '{os.path.basename(output_path)}'[/]"
+                _notify(
+                    f":x: [bold red]Error: Final size ({final_size}) doesn't match expected ({total_size}). Download may be corrupt.[/]",
+                    level=logging.ERROR,
                 )
-                _unzip_and_remove(output_path, extract_path)
+                _cleanup_incomplete_file(part_path)
+                return False
+            os.replace(part_path, output_path)
+            _notify(
+                f":white_check_mark: [bold green]Successfully downloaded '{zip_name}'[/]"
+            )
+            return _unzip_and_remove(output_path, extract_path)
     except requests.exceptions.HTTPError as e:
         logger.error(f"HTTP Error downloading {download_target_description}: {e}")
-        console.print(
-            f":x: [bold red]HTTP Error downloading '{os.path.basename(output_path)}'. Status: {e.response.status_code}. Check logs.[/]"
+        _notify(
+            f":x: [bold red]HTTP Error downloading '{zip_name}'. Status: {e.response.status_code}. Check logs.[/]",
+            level=None,
         )
-        _cleanup_incomplete_file(output_path)
+        return False
     except requests.exceptions.RequestException as e:
+        # Keep the partial file so the next attempt resumes where this one stopped
         logger.error(
             f"Network/Request Error downloading {download_target_description}: {e}"
         )
-        console.print(
-            f":x: [bold red]Network Error downloading '{os.path.basename(output_path)}'. Check connection and logs.[/]"
+        _notify(
+            f":x: [bold red]Network Error downloading '{zip_name}'. Check connection and logs.[/]",
+            level=None,
         )
-        _cleanup_incomplete_file(output_path)
+        return False
     except Exception as e:
         logger.error(
             f"An unexpected error occurred during download of {download_target_description}: {e}"
         )
-        console.print(
-            f":x: [bold red]Unexpected error during download of '{os.path.basename(output_path)}'. Check logs.[/]"
+        _notify(
+            f":x: [bold red]Unexpected error during download of '{zip_name}'. Check logs.[/]",
+            level=None,
         )
-        _cleanup_incomplete_file(output_path)
+        _cleanup_incomplete_file(part_path)
+        return False
 
 
-def _unzip_and_remove(zip_path: str, extract_dir: str) -> bool:
-    if not zip_path.lower().endswith(".zip"):
+def download_products(
+    items: list[tuple[str, str]],
+    access_token: str,
+    output_dir: str = ".",
+    max_workers: int = 4,
+) -> dict[str, Exception | None]:
+    """Download several products concurrently.
+
+    Each item is a (product_id, product_name) pair handled by download_product.
+    Returns a mapping of product name to the error that stopped it, or None
+    when the product was downloaded and extracted.
+    """
+    results: dict[str, Exception | None] = {}
+    if not items:
+        return results
+    max_workers = max(1, min(max_workers, len(items)))
+    session = _new_session(pool_connections=max_workers, pool_maxsize=max_workers)
+    progress = _new_download_progress()
+    with session, progress, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                download_product,
+                product_id,
+                product_name=product_name,
+                access_token=access_token,
+                output_dir=output_dir,
+                session=session,
+                progress=progress,
+            ): product_name
+            for product_id, product_name in items
+        }
+        for future in as_completed(futures):
+            product_name = futures[future]
+            try:
+                if future.result():
+                    results[product_name] = None
+                else:
+                    results[product_name] = RuntimeError(
+                        "download or extraction failed (see log for details)"
+                    )
+            except Exception as e:
+                logger.error(f"Download of {product_name} failed: {e}")
+                results[product_name] = e
+    return results
+
+
+def _unzip_and_remove(zip_path: Path, extract_dir: Path) -> bool:
+    if zip_path.suffix.lower() != ".zip":
         logger.warning(f"Attempted to unzip non-zip file: {zip_path}")
         return False
-    console.print(
-        f":open_file_folder: Extracting [cyan]{os.path.basename(zip_path)}[/] to [cyan]{os.path.basename(extract_dir)}[/]..."
+    zip_name = zip_path.name
+    _notify(
+        f":open_file_folder: Extracting [cyan]{zip_name}[/] to [cyan]{extract_dir.name}[/]..."
     )
     try:
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        # Large explicit buffer: fewer syscalls walking the central directory of big SAFE archives
+        with open(zip_path, "rb", buffering=0) as raw, io.BufferedReader(
+            raw, buffer_size=ZIP_READ_BUFFER_SIZE
+        ) as buffered, zipfile.ZipFile(buffered, "r") as zip_ref:
             os.makedirs(extract_dir, exist_ok=True)
-            zip_ref.extractall(extract_dir)
-        console.print(":white_check_mark: [green]Extraction complete.[/]")
+            _extract_members(zip_ref, zip_path, extract_dir)
+        _notify(":white_check_mark: [green]Extraction complete.[/]")
         try:
             os.remove(zip_path)
-            console.print(
-                f":wastebasket: [dim]Removed archive '{os.path.basename(zip_path)}'.[/]"
+            _notify(
+                f":wastebasket: [dim]Removed archive '{zip_name}'.[/]"
             )
             return True
         except OSError as e:
             logger.error(f"Failed to remove zip archive {zip_path}: {e}")
-            console.print(
-                f":warning: [yellow]Could not remove zip archive '{os.path.basename(zip_path)}'.[/]"
+            _notify(
+                f":warning: [yellow]Could not remove zip archive '{zip_name}'.[/]",
+                level=None,
             )
             return True
     except zipfile.BadZipFile:
+        # A half-extracted directory would otherwise be taken as a finished product
+        shutil.rmtree(extract_dir, ignore_errors=True)
         logger.error(f"Failed to unzip {zip_path}: Bad zip file.")
-        console.print(
-            f":x: [red]Error: Could not unzip '{os.path.basename(zip_path)}'. File may be corrupt.[/]"
+        _notify(
+            f":x: [red]Error: Could not unzip '{zip_name}'. File may be corrupt.[/]",
+            level=None,
         )
         return False
     except Exception as e:
+        shutil.rmtree(extract_dir, ignore_errors=True)
         logger.error(
             f"An unexpected error occurred during unzipping of {zip_path}: {e}"
         )
-        console.print(
-            f":x: [red]Error: An unexpected error occurred during unzipping '{os.path.basename(zip_path)}'.[/]"
+        _notify(
+            f":x: [red]Error: An unexpected error occurred during unzipping '{zip_name}'.[/]",
+            level=None,
         )
         return False
 
 
+def _member_target_path(extract_dir: str, member_name: str) -> str | None:
+    # Mirror extractall's sanitising: never write outside extract_dir
+    target = os.path.realpath(os.path.join(extract_dir, member_name))
+    root = os.path.realpath(extract_dir)
+    if os.path.commonpath([root, target]) != root:
+        logger.warning(f"Skipping zip member outside extraction directory: {member_name}")
+        return None
+    return target
+
+
+def _stored_data_offset(zip_fd: int, member: zipfile.ZipInfo) -> int:
+    # The local header's name/extra lengths can differ from the central directory's
+    header = os.pread(zip_fd, zipfile.sizeFileHeader, member.header_offset)
+    fields = struct.unpack(zipfile.structFileHeader, header)
+    if fields[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for {member.filename}")
+    name_length, extra_length = fields[-2], fields[-1]
+    return member.header_offset + zipfile.sizeFileHeader + name_length + extra_length
+
+
+def _sendfile_member(zip_fd: int, member: zipfile.ZipInfo, dst):
+    offset = _stored_data_offset(zip_fd, member)
+    remaining = member.file_size
+    while remaining > 0:
+        sent = os.sendfile(dst.fileno(), zip_fd, offset, remaining)
+        if sent == 0:
+            raise zipfile.BadZipFile(f"Truncated data for {member.filename}")
+        offset += sent
+        remaining -= sent
+    # The kernel copy bypasses ZipExtFile's CRC-32 check, so verify the written bytes
+    crc = 0
+    position = 0
+    while position < member.file_size:
+        chunk = os.pread(dst.fileno(), EXTRACT_COPY_BUFFER_SIZE, position)
+        if not chunk:
+            break
+        crc = zlib.crc32(chunk, crc)
+        position += len(chunk)
+    if crc != member.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {member.filename!r}")
+
+
+def _extract_member(
+    zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo, target: str, zip_fd: int | None
+):
+    if member.file_size == 0:
+        open(target, "wb").close()
+        return
+    # STORED, unencrypted members are copied kernel-side without passing through Python
+    if (
+        zip_fd is not None
+        and member.compress_type == zipfile.ZIP_STORED
+        and not member.flag_bits & 0x1
+    ):
+        with open(target, "w+b") as dst:
+            _sendfile_member(zip_fd, member, dst)
+        return
+    with zip_ref.open(member) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, min(member.file_size, EXTRACT_COPY_BUFFER_SIZE))
+
+
+def _extract_members(zip_ref: zipfile.ZipFile, zip_path: Path, extract_dir: Path):
+    # Resolve targets and create every directory up front, so workers only write files
+    files = []
+    directories = set()
+    for member in zip_ref.infolist():
+        target = _member_target_path(extract_dir, member.filename)
+        if target is None:
+            continue
+        if member.is_dir():
+            directories.add(target)
+        else:
+            directories.add(os.path.dirname(target))
+            files.append((member, target))
+    for directory in sorted(directories):
+        os.makedirs(directory, exist_ok=True)
+    # zlib releases the GIL while inflating, and each ZipFile.open() returns an
+    # independent member stream, so members decompress in parallel
+    max_workers = min(EXTRACT_MAX_WORKERS, os.cpu_count() or 4, max(len(files), 1))
+    # sendfile/pread take explicit offsets, so one descriptor is shared by all workers
+    zip_fd = os.open(zip_path, os.O_RDONLY) if ZERO_COPY_EXTRACT else None
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_extract_member, zip_ref, member, target, zip_fd)
+                for member, target in files
+            ]
+            for future in futures:
+                future.result()
+    finally:
+        if zip_fd is not None:
+            os.close(zip_fd)
+
+
 def _cleanup_incomplete_file(file_path: str):
     if os.path.exists(file_path):
         try:
@@ -229,11 +596,10 @@ def _cleanup_incomplete_file(file_path: str):
 def _download_file_with_progress(
     url, headers, output_path, description, total_size=None
 ):
-    response = requests.get(url, headers=headers, stream=True, allow_redirects=True)
+    response = _SESSION.get(url, headers=headers, stream=True, allow_redirects=True)
     response.raise_for_status()
     if total_size is None:
         total_size = int(response.headers.get("content-length", 0))
-    block_size = 8192
     with Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
@@ -242,13 +608,13 @@ def _download_file_with_progress(
         TransferSpeedColumn(),
         "|",
         TimeElapsedColumn(),
+        console=console,
+        disable=not _IS_TTY,
+        refresh_per_second=4,
     ) as progress:
         task_id = progress.add_task(description, total=total_size)
         with open(output_path, "wb") as f:
-            for chunk in response.iter_content(block_size):
-                if chunk:
-                    f.write(chunk)
-                    progress.update(task_id, advance=len(chunk))
+            _stream_to_file(response, f, progress, task_id)
     if total_size != 0 and not progress.tasks[task_id].finished:
         print(
             f"[Warning] Download of {description} finished, but progress bar did not complete."
@@ -6,9 +6,12 @@ configuration files defining collection jobs and schedules.
 """
 
 import logging
+import signal
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -23,28 +26,72 @@ from config_schema import (
 )
 from collection_core import run_collection, CollectionResult
 
+logger = logging.getLogger("scheduler")
+
+_WEEKDAY_MAP = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6
+}
+
+
+def _parse_time(time_str: str) -> tuple[int, int]:
+    """Parse an HH:MM schedule time into (hour, minute)."""
+    hour, minute = time_str.split(':')
+    return int(hour), int(minute)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> SchedulerConfig:
+    """Parse a configuration file once per (path, modification time)."""
+    return load_config(config_path)
+
+
+def load_config_cached(config_path: str) -> SchedulerConfig:
+    """
+    Load configuration, reusing the parsed result while the file is unchanged.
+    
+    The returned object is shared between callers and must not be mutated.
+    
+    Args:
+        config_path: Path to YAML configuration file
+        
+    Returns:
+        Validated SchedulerConfig object
+    """
+    config_file = Path(config_path).expanduser()
+    if not config_file.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    return _load_config_cached(str(config_file), config_file.stat().st_mtime_ns)
+
 
 class ScheduledCollector:
     """Main scheduler class for orchestrating automatic collection jobs."""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config: Union[str, SchedulerConfig]):
         """
-        Initialize the scheduler with a configuration file.
+        Initialize the scheduler with a configuration file or loaded configuration.
         
         Args:
-            config_path: Path to YAML configuration file
+            config: Path to YAML configuration file, or an already validated
+                SchedulerConfig (e.g. the one returned by startup validation)
         """
-        self.config_path = config_path
+        self.config_path = None if isinstance(config, SchedulerConfig) else config
         self.config: Optional[SchedulerConfig] = None
         self.scheduler: Optional[BackgroundScheduler] = None
+        self._stop_event = threading.Event()
         self._setup_logging()
         
+        if isinstance(config, SchedulerConfig):
+            self.config = config
+            logger.info("Using preloaded configuration with %d jobs", len(self.config.jobs))
+            return
+        
         # Load configuration
         try:
-            self.config = load_config(config_path)
-            logging.info(f"Loaded configuration with {len(self.config.jobs)} jobs")
+            self.config = load_config_cached(config)
+            logger.info("Loaded configuration with %d jobs", len(self.config.jobs))
         except Exception as e:
-            logging.error(f"Failed to load configuration: {e}", exc_info=True)
+            logger.error("Failed to load configuration: %s", e, exc_info=True)
             raise
     
     def _setup_logging(self):
@@ -66,15 +113,15 @@ class ScheduledCollector:
         file_handler.setFormatter(formatter)
         
         # Add handler to root logger
-        logger = logging.getLogger()
-        logger.setLevel(logging.INFO)
-        logger.addHandler(file_handler)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(file_handler)
         
         # Also add console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        root_logger.addHandler(console_handler)
     
     def setup_jobs(self):
         """Setup all configured jobs in the scheduler."""
@@ -99,14 +146,26 @@ class ScheduledCollector:
             EVENT_JOB_ERROR
         )
         
-        # Add jobs
+        self._add_jobs()
+    
+    def _add_jobs(self):
+        """Add the enabled jobs from the current configuration to the scheduler."""
+        # Build every trigger first so schedule errors surface before any job is added
+        scheduled_jobs = []
         for job_config in self.config.jobs:
             if not job_config.enabled:
-                logging.info(f"Skipping disabled job: {job_config.name}")
+                logger.info("Skipping disabled job: %s", job_config.name)
                 continue
             
             try:
-                trigger = self._create_trigger(job_config)
+                scheduled_jobs.append((job_config, self._create_trigger(job_config)))
+            except Exception as e:
+                logger.error("Failed to add job %s: %s", job_config.name, e, exc_info=True)
+        
+        # Before start() APScheduler queues these and commits them when the scheduler
+        # starts; on a running scheduler (reload_config) each add_job writes immediately
+        for job_config, trigger in scheduled_jobs:
+            try:
                 self.scheduler.add_job(
                     func=self.execute_job,
                     trigger=trigger,
@@ -115,9 +174,34 @@ class ScheduledCollector:
                     name=job_config.name,
                     replace_existing=True,
                 )
-                logging.info(f"Added job: {job_config.name} with schedule: {job_config.schedule.type}")
+                logger.info("Added job: %s with schedule: %s", job_config.name, job_config.schedule.type)
             except Exception as e:
-                logging.error(f"Failed to add job {job_config.name}: {e}", exc_info=True)
+                logger.error("Failed to add job %s: %s", job_config.name, e, exc_info=True)
+    
+    def reload_config(self, config_path: Optional[str] = None):
+        """
+        Reload the configuration file and replace the scheduled jobs.
+        
+        Scheduler-wide job defaults (coalesce, max_instances) keep the values
+        the scheduler was created with.
+        
+        Args:
+            config_path: Path to YAML configuration file; defaults to the path
+                this collector was created with
+        """
+        config_path = config_path or self.config_path
+        if config_path is None:
+            raise RuntimeError("No configuration path to reload from")
+        if self.scheduler is None:
+            raise RuntimeError("Jobs not setup. Call setup_jobs() first.")
+        
+        # Parse before touching the scheduler so a broken file keeps the current jobs
+        config = load_config_cached(config_path)
+        self.config = config
+        self.config_path = config_path
+        self.scheduler.remove_all_jobs()
+        self._add_jobs()
+        logger.info("Reloaded configuration with %d jobs", len(config.jobs))
     
     def _create_trigger(self, job_config: CollectionJobConfig):
         """
@@ -130,7 +214,7 @@ class ScheduledCollector:
             APScheduler trigger object
         """
         schedule = job_config.schedule
-        hour, minute = map(int, schedule.time.split(':'))
+        hour, minute = _parse_time(schedule.time)
         
         if schedule.type == "yearly":
             return self._create_yearly_trigger(schedule.month, schedule.day, hour, minute)
@@ -163,22 +247,17 @@ class ScheduledCollector:
     def _create_weekly_trigger(self, day_of_week: str, hour: int, minute: int) -> CronTrigger:
         """Create a weekly cron trigger."""
         # Convert day name to number if needed
-        day_map = {
-            "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-            "friday": 4, "saturday": 5, "sunday": 6
-        }
-        
+        if day_of_week is None:
+            raise ValueError("Weekly schedule requires day_of_week")
         if isinstance(day_of_week, str):
-            day_of_week_lower = day_of_week.lower()
-            if day_of_week_lower in day_map:
-                day_num = day_map[day_of_week_lower]
-            else:
+            day_num = _WEEKDAY_MAP.get(day_of_week.lower())
+            if day_num is None:
                 try:
                     day_num = int(day_of_week)
                 except ValueError:
                     raise ValueError(f"Invalid day_of_week: {day_of_week}")
         else:
-            day_num = day_of_week
+            day_num = int(day_of_week)
         
         return CronTrigger(
             day_of_week=day_num,
@@ -211,62 +290,68 @@ class ScheduledCollector:
             job_config: Collection job configuration
         """
         job_name = job_config.name
-        logging.info(f"Starting job execution: {job_name}")
+        logger.info("Starting job execution: %s", job_name)
         
         try:
             # Resolve date range
             start_date, end_date = resolve_date_range(job_config.date_range)
-            logging.info(f"Job {job_name}: Date range {start_date} to {end_date}")
-            
-            # Expand paths
-            aoi_path = str(Path(job_config.aoi_path).expanduser())
-            output_dir = str(Path(job_config.output_dir).expanduser())
+            logger.info("Job %s: Date range %s to %s", job_name, start_date, end_date)
             
             # Run collection
             result: CollectionResult = run_collection(
-                aoi_path=aoi_path,
+                aoi_path=str(job_config.resolved_aoi_path),
                 start_date=start_date,
                 end_date=end_date,
                 max_cloud=job_config.filters.max_cloud_cover,
                 min_aoi=job_config.filters.min_aoi_coverage,
                 product_level=job_config.filters.product_level,
-                output_dir=output_dir,
+                output_dir=str(job_config.resolved_output_dir),
                 auto_select_strategy=job_config.auto_select.strategy,
                 max_products=job_config.auto_select.max_products,
                 quality_threshold=job_config.auto_select.quality_threshold,
                 aoi_weight=job_config.auto_select.aoi_coverage_weight,
                 cloud_weight=job_config.auto_select.cloud_cover_weight,
                 recency_weight=job_config.auto_select.recency_weight,
+                parallel_downloads=job_config.parallel_downloads,
+                coverage_cache_dir=(
+                    str(job_config.resolved_coverage_cache_dir)
+                    if job_config.resolved_coverage_cache_dir is not None
+                    else None
+                ),
             )
             
             # Log results
             if result.success:
-                logging.info(
-                    f"Job {job_name} completed successfully: {result.message}. "
-                    f"Downloaded: {len(result.downloaded_products)}, "
-                    f"Found: {result.total_products_found}, "
-                    f"Filtered: {result.total_products_filtered}"
+                logger.info(
+                    "Job %s completed successfully: %s. Downloaded: %d, Found: %d, Filtered: %d",
+                    job_name,
+                    result.message,
+                    len(result.downloaded_products),
+                    result.total_products_found,
+                    result.total_products_filtered,
                 )
                 if result.downloaded_products:
-                    logging.info(f"Job {job_name} downloaded products: {', '.join(result.downloaded_products)}")
+                    logger.info("Job %s downloaded products: %s", job_name, ", ".join(result.downloaded_products))
             else:
-                logging.error(f"Job {job_name} failed: {result.message}")
+                logger.error("Job %s failed: %s", job_name, result.message)
             
             if result.errors:
                 for error in result.errors:
-                    logging.error(f"Job {job_name} error: {error}")
+                    logger.error("Job %s error: %s", job_name, error)
             
         except Exception as e:
-            logging.error(f"Job {job_name} execution failed with exception: {e}", exc_info=True)
+            logger.error("Job %s execution failed with exception: %s", job_name, e, exc_info=True)
             raise
     
     def _job_executed_listener(self, event):
         """Listener for successful job executions."""
-        logging.info(f"Job {event.job_id} executed successfully")
+        logger.info("Job %s executed successfully", event.job_id)
     
     def _job_error_listener(self, event):
         """Listener for job execution errors."""
-        logging.error(f"Job {event.job_id} raised an error: {event.exception}", exc_info=True)
+        logger.error(
+            "Job %s raised an error: %s", event.job_id, event.exception, exc_info=event.exception
+        )
     
     def start(self):
         """Start the scheduler."""
@@ -274,36 +359,53 @@ class ScheduledCollector:
             raise RuntimeError("Jobs not setup. Call setup_jobs() first.")
         
         self.scheduler.start()
-        logging.info("Scheduler started")
+        logger.info("Scheduler started")
         
         # Log next run times
         jobs = self.scheduler.get_jobs()
         for job in jobs:
             next_run = job.next_run_time
-            logging.info(f"Job '{job.id}' next run: {next_run}")
+            logger.info("Job '%s' next run: %s", job.id, next_run)
     
     def stop(self):
         """Stop the scheduler gracefully."""
-        if self.scheduler is not None:
+        self._stop_event.set()
+        if self.scheduler is not None and self.scheduler.running:
             self.scheduler.shutdown(wait=True)
-            logging.info("Scheduler stopped")
+            logger.info("Scheduler stopped")
     
-    def run_forever(self):
+    def run_forever(self, handle_signals: bool = True):
         """
         Run the scheduler indefinitely (blocking call).
         
-        This method blocks until interrupted (Ctrl+C).
+        This method blocks until interrupted (Ctrl+C, SIGTERM) or stop() is called.
+        
+        Args:
+            handle_signals: Install SIGINT/SIGTERM handlers for the duration of
+                the call; pass False when the caller manages signals itself
         """
+        if self._stop_event.is_set():
+            # stop() was already requested, e.g. by a signal during startup
+            return
         if self.scheduler is None or not self.scheduler.running:
             raise RuntimeError("Scheduler not started. Call start() first.")
         
+        # Wake the main thread only on shutdown instead of polling
+        previous_handlers = {}
+        if handle_signals and threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                previous_handlers[signum] = signal.signal(
+                    signum, lambda *_: self._stop_event.set()
+                )
+        
         try:
-            # Keep the main thread alive
-            import time
-            while True:
-                time.sleep(1)
+            self._stop_event.wait()
+            logger.info("Received shutdown signal")
         except (KeyboardInterrupt, SystemExit):
-            logging.info("Received shutdown signal")
+            logger.info("Received shutdown signal")
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
             self.stop()
     
     def get_status(self) -> dict:
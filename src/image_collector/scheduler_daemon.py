@@ -5,61 +5,182 @@ This script provides a command-line interface for running the scheduler
 as a long-running service, with support for daemon mode and process management.
 """
 
-import argparse
+import atexit
+import importlib
 import logging
 import sys
 import signal
 import os
+import threading
+from collections import defaultdict
+from concurrent.futures import Future
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
 
-from scheduler import ScheduledCollector
-from config_schema import load_config
+logger = logging.getLogger(__name__)
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
-def setup_signal_handlers(collector: ScheduledCollector):
+# Grace period for running jobs after the first shutdown signal
+SHUTDOWN_TIMEOUT_SECONDS = 5
+
+NEXT_RUN_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Project root .env holding the CDSE credentials
+ENV_PATH = Path(__file__).resolve().parent.parent.parent / ".env"
+
+# PID file written by this process and the descriptor holding its lock
+_pid_file_path: Optional[str] = None
+_pid_file_fd: Optional[int] = None
+
+# scheduler/config_schema pull in APScheduler, requests and rich; they are
+# imported where used so --help and argument errors return immediately
+if TYPE_CHECKING:
+    from rich.console import Console
+    from scheduler import ScheduledCollector
+    from config_schema import SchedulerConfig
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+    
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def _dotenv_snapshot(env_path: str, mtime_ns: int) -> dict:
+    """Parse a .env file once per (path, modification time), dropping unset keys."""
+    from dotenv import dotenv_values
+    
+    return {key: value for key, value in dotenv_values(env_path).items() if value is not None}
+
+
+def setup_signal_handlers(collector: "ScheduledCollector", config_path: Optional[str] = None):
     """
-    Setup signal handlers for graceful shutdown.
+    Setup signal handlers for graceful shutdown and configuration reload.
+    
+    The first SIGTERM/SIGINT stops the scheduler gracefully; a second one, or
+    a shutdown that takes longer than SHUTDOWN_TIMEOUT_SECONDS, exits at once.
+    SIGHUP reloads the configuration file.
     
     Args:
         collector: ScheduledCollector instance
+        config_path: Configuration file to reload on SIGHUP; defaults to the
+            path the collector was created with
     """
+    exit_requested = [False]
+    
     def signal_handler(signum, frame):
-        logging.info(f"Received signal {signum}, shutting down gracefully...")
+        if exit_requested[0]:
+            logger.warning("Received %s again, exiting immediately", signal.Signals(signum).name)
+            _hard_exit(128 + signum)
+        exit_requested[0] = True
+        logger.info("Received %s, shutting down gracefully...", signal.Signals(signum).name)
+        watchdog = threading.Timer(SHUTDOWN_TIMEOUT_SECONDS, _hard_exit, args=(128 + signum,))
+        watchdog.daemon = True
+        watchdog.start()
         collector.stop()
-        sys.exit(0)
+        watchdog.cancel()
+    
+    def reload_handler(signum, frame):
+        logger.info("Received SIGHUP, reloading configuration...")
+        # Reload off the signal handler: it takes the scheduler's job store lock
+        threading.Thread(
+            target=_reload_config, args=(collector, config_path), daemon=True
+        ).start()
     
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, reload_handler)
+
 
+def _hard_exit(code: int):
+    # os._exit skips atexit handlers, so release the PID file here
+    if _pid_file_path is not None:
+        remove_pid_file(_pid_file_path)
+    os._exit(code)
 
-def validate_startup(config_path: str) -> bool:
+
+def _reload_config(collector: "ScheduledCollector", config_path: Optional[str]):
+    try:
+        collector.reload_config(config_path)
+    except Exception as e:
+        logger.error("Configuration reload failed, keeping current jobs: %s", e, exc_info=True)
+
+
+def check_aoi_files(jobs) -> dict:
+    """
+    Check which jobs' AOI files exist, listing each AOI directory only once.
+    
+    Args:
+        jobs: Collection job configurations
+        
+    Returns:
+        Dictionary mapping job name to whether its AOI file exists
+    """
+    jobs_by_dir = defaultdict(list)
+    for job in jobs:
+        aoi_path = job.resolved_aoi_path
+        jobs_by_dir[aoi_path.parent].append((job.name, aoi_path.name))
+    
+    exists = {}
+    for directory, entries in jobs_by_dir.items():
+        try:
+            with os.scandir(directory) as it:
+                names = {entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            names = set()
+        for job_name, file_name in entries:
+            exists[job_name] = file_name in names
+    return exists
+
+
+def validate_startup(config_path: str, check_network: bool = False) -> Optional["SchedulerConfig"]:
     """
     Validate startup conditions before running scheduler.
     
     Args:
         config_path: Path to configuration file
+        check_network: Obtain an access token even when CDSE_ACCESS_TOKEN is
+            already provided
         
     Returns:
-        True if validation passes, False otherwise
+        The validated configuration if validation passes, None otherwise
     """
-    from dotenv import load_dotenv
-    from rich.console import Console
-    
-    console = Console()
+    console = _console()
+    # Buffer the report and write it to the terminal in one go on exit
+    with console:
+        return _validate_startup(console, config_path, check_network)
+
+
+def _validate_startup(
+    console: "Console", config_path: str, check_network: bool
+) -> Optional["SchedulerConfig"]:
+    from config_schema import load_config
     
-    # Check .env file exists
-    env_path = Path(__file__).parent.parent.parent / ".env"
-    if not env_path.exists():
-        console.print(f"[red]Error: .env file not found at {env_path}[/red]")
+    # Check .env file exists; its mtime keys the parsed snapshot
+    try:
+        env_mtime_ns = ENV_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        console.print(f"[red]Error: .env file not found at {ENV_PATH}[/red]")
         console.print("Please create a .env file with CDSE credentials")
-        return False
+        return None
     
-    # Load and check credentials
-    load_dotenv()
-    has_token = os.getenv("CDSE_ACCESS_TOKEN") is not None
+    # Check credentials; like load_dotenv(), the process environment takes precedence
+    dotenv_vars = _dotenv_snapshot(str(ENV_PATH), env_mtime_ns)
+    env = os.environ
+    has_token = "CDSE_ACCESS_TOKEN" in env or "CDSE_ACCESS_TOKEN" in dotenv_vars
     has_credentials = (
-        os.getenv("CDSE_USERNAME") is not None and 
-        os.getenv("CDSE_PASSWORD") is not None
+        ("CDSE_USERNAME" in env or "CDSE_USERNAME" in dotenv_vars) and
+        ("CDSE_PASSWORD" in env or "CDSE_PASSWORD" in dotenv_vars)
     )
     
     if not (has_token or has_credentials):
@@ -67,7 +188,13 @@ def validate_startup(config_path: str) -> bool:
         console.print("Please set either:")
         console.print("  - CDSE_ACCESS_TOKEN, or")
         console.print("  - CDSE_USERNAME and CDSE_PASSWORD")
-        return False
+        return None
+    
+    # The token request does not depend on the configuration, so overlap it
+    # with config parsing and the AOI checks
+    token_future = None
+    if check_network or not has_token:
+        token_future = _start_token_fetch()
     
     # Validate configuration
     try:
@@ -83,9 +210,9 @@ def validate_startup(config_path: str) -> bool:
         # Check AOI files
         console.print("\n[bold cyan]Validating AOI files:[/bold cyan]")
         all_aois_exist = True
+        aoi_exists = check_aoi_files(config.jobs)
         for job in config.jobs:
-            aoi_path = Path(job.aoi_path).expanduser()
-            if aoi_path.exists():
+            if aoi_exists[job.name]:
                 console.print(f"  ✓ {job.name}: {job.aoi_path}")
             else:
                 console.print(f"  [red]✗ {job.name}: {job.aoi_path} (NOT FOUND)[/red]")
@@ -93,39 +220,72 @@ def validate_startup(config_path: str) -> bool:
         
         if not all_aois_exist:
             console.print("[red]Some AOI files are missing. Please check the configuration.[/red]")
-            return False
+            return None
         
         # Test API connectivity
         console.print("\n[bold cyan]Testing CDSE API connectivity:[/bold cyan]")
+        if token_future is None:
+            # Nothing to verify without a request; also skips importing collector
+            console.print("  ✓ Using pre-provided CDSE_ACCESS_TOKEN (skipping live check)")
+            console.print("\n[green]All startup validations passed![/green]")
+            return config
         try:
-            from collector import get_access_token
-            token = get_access_token()
+            token_future.result()
             console.print("  ✓ Successfully obtained access token")
         except Exception as e:
             console.print(f"  [red]✗ Failed to obtain access token: {e}[/red]")
-            return False
+            return None
         
         console.print("\n[green]All startup validations passed![/green]")
-        return True
+        return config
         
     except Exception as e:
         console.print(f"[red]Configuration validation failed: {e}[/red]")
-        logging.error(f"Configuration validation error: {e}", exc_info=True)
-        return False
+        logger.error("Configuration validation error: %s", e, exc_info=True)
+        return None
 
 
-def display_schedule_info(collector: ScheduledCollector):
+def _fetch_access_token() -> str:
+    from collector import get_access_token
+    
+    return get_access_token()
+
+
+def _start_token_fetch() -> Future:
+    """
+    Request an access token on a daemon thread.
+    
+    An executor's worker would be joined at interpreter exit, so a validation
+    failure returning early would still wait out a slow token request.
+    """
+    future = Future()
+    
+    def fetch():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_fetch_access_token())
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=fetch, name="cdse-token-fetch", daemon=True).start()
+    return future
+
+
+def display_schedule_info(collector: "ScheduledCollector", status: Optional[dict] = None):
     """
     Display information about scheduled jobs.
     
     Args:
         collector: ScheduledCollector instance
+        status: Snapshot from collector.get_status() to reuse instead of
+            querying the scheduler again
     """
-    from rich.console import Console
     from rich.table import Table
     
-    console = Console()
-    status = collector.get_status()
+    console = _console()
+    if status is None:
+        status = collector.get_status()
     
     if not status["jobs"]:
         console.print("[yellow]No jobs scheduled[/yellow]")
@@ -135,51 +295,133 @@ def display_schedule_info(collector: ScheduledCollector):
     table.add_column("Job Name", style="cyan")
     table.add_column("Next Run", style="green")
     
-    for job_info in status["jobs"]:
-        next_run = job_info["next_run_time"]
-        if next_run:
-            # Parse and format datetime
-            from datetime import datetime
-            next_run_dt = datetime.fromisoformat(next_run)
-            next_run_str = next_run_dt.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            next_run_str = "Not scheduled"
-        
-        table.add_row(job_info["name"], next_run_str)
+    rows = [
+        (
+            job_info["name"],
+            datetime.fromisoformat(job_info["next_run_time"]).strftime(NEXT_RUN_FORMAT)
+            if job_info["next_run_time"]
+            else "Not scheduled",
+        )
+        for job_info in status["jobs"]
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
 
 def write_pid_file(pid_file: str):
     """
-    Write process ID to file.
+    Write process ID to file and hold a lock on it for the process lifetime.
+    
+    The PID file itself is opened and locked before it is rewritten, so of two
+    daemons starting together exactly one gets the lock. A stale file left by
+    a crashed process is reused; a file still locked by a running daemon is not.
     
     Args:
         pid_file: Path to PID file
+        
+    Raises:
+        RuntimeError: If another running process holds the PID file
     """
+    global _pid_file_path, _pid_file_fd
     pid = os.getpid()
-    with open(pid_file, 'w') as f:
-        f.write(str(pid))
-    logging.info(f"PID {pid} written to {pid_file}")
+    flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+    while True:
+        fd = os.open(pid_file, flags, 0o644)
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    raise RuntimeError(
+                        f"PID file {pid_file} is locked by another running process"
+                    ) from None
+            # The previous owner may have unlinked the file between our open and
+            # flock; a lock on that orphaned inode would guard nothing
+            try:
+                same_file = os.path.samestat(os.fstat(fd), os.stat(pid_file))
+            except FileNotFoundError:
+                same_file = False
+            if same_file:
+                os.ftruncate(fd, 0)
+                os.write(fd, f"{pid}\n".encode())
+                break
+        except BaseException:
+            os.close(fd)
+            raise
+        os.close(fd)
+    # Keep the descriptor open: the lock lasts as long as this process
+    _pid_file_path = pid_file
+    _pid_file_fd = fd
+    logger.info("PID %d written to %s", pid, pid_file)
 
 
 def remove_pid_file(pid_file: str):
     """
-    Remove PID file.
+    Remove PID file if it belongs to this process.
     
     Args:
         pid_file: Path to PID file
     """
+    global _pid_file_path, _pid_file_fd
     try:
-        if os.path.exists(pid_file):
-            os.remove(pid_file)
-            logging.info(f"Removed PID file {pid_file}")
-    except Exception as e:
-        logging.warning(f"Failed to remove PID file {pid_file}: {e}")
+        with open(pid_file) as f:
+            owner = f.read().strip()
+        if owner == str(os.getpid()):
+            os.unlink(pid_file)
+            logger.info("Removed PID file %s", pid_file)
+        else:
+            logger.warning("PID file %s belongs to process %s; leaving it in place", pid_file, owner)
+    except FileNotFoundError:
+        # Already gone, e.g. cleaned up by the service manager
+        pass
+    except OSError as e:
+        logger.warning("Failed to remove PID file %s: %s", pid_file, e)
+    finally:
+        if _pid_file_fd is not None:
+            os.close(_pid_file_fd)
+            _pid_file_fd = None
+        _pid_file_path = None
+
+
+def _preload_modules():
+    # Import errors are ignored here and raised again at the real import sites
+    for module_name in ("config_schema", "scheduler"):
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            return
+
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def _validate_only_config(argv: list) -> Optional[str]:
+    """Return the config path if argv is exactly `--config PATH --validate-only`."""
+    if len(argv) == 4 and argv[1] == "--config" and argv[3] == "--validate-only":
+        return argv[2]
+    return None
 
 
 def main():
     """Main entry point for the scheduler daemon."""
+    # Fast path for CI config checks: no argparse parser construction
+    config_path = _validate_only_config(sys.argv)
+    if config_path is not None:
+        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+        if validate_startup(config_path) is None:
+            sys.exit(1)
+        print("Configuration validation successful. Exiting.")
+        sys.exit(0)
+    
+    # Import the scheduler stack while argv is parsed; a daemon thread is not
+    # joined at exit, so --help and usage errors still return immediately
+    preload = threading.Thread(target=_preload_modules, name="preload-imports", daemon=True)
+    preload.start()
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Satellite Image Collection Scheduler Daemon",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -226,16 +468,24 @@ Examples:
         help="Only validate configuration and exit"
     )
     
+    parser.add_argument(
+        "--check-network",
+        action="store_true",
+        help="Obtain an access token during validation even if CDSE_ACCESS_TOKEN is set"
+    )
+    
     args = parser.parse_args()
+    preload.join()
     
     # Setup logging level
     logging.basicConfig(
         level=getattr(logging, args.log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        format=LOG_FORMAT
     )
     
-    # Validate startup conditions
-    if not validate_startup(args.config):
+    # Validate startup conditions; the validated config is reused by the scheduler
+    config = validate_startup(args.config, check_network=args.check_network)
+    if config is None:
         sys.exit(1)
     
     if args.validate_only:
@@ -260,64 +510,71 @@ Examples:
                 working_directory=str(Path(__file__).parent),
                 pidfile=daemon.pidfile.PIDLockFile(pid_file),
             ):
-                run_scheduler(args.config, args.pid_file)
+                run_scheduler(config, args.pid_file, config_path=args.config)
         except ImportError:
             print("Error: python-daemon library not installed.")
             print("Install with: pip install python-daemon")
             sys.exit(1)
     else:
         # Run in foreground
-        run_scheduler(args.config, args.pid_file)
+        run_scheduler(config, args.pid_file, config_path=args.config)
 
 
-def run_scheduler(config_path: str, pid_file: str = None):
+def run_scheduler(
+    config: Union[str, "SchedulerConfig"],
+    pid_file: str = None,
+    config_path: Optional[str] = None,
+):
     """
     Run the scheduler.
     
     Args:
-        config_path: Path to configuration file
+        config: Path to configuration file, or an already validated configuration
         pid_file: Optional path to PID file
+        config_path: Configuration file to reload on SIGHUP when config is
+            already loaded
     """
-    from rich.console import Console
+    from scheduler import ScheduledCollector
     
-    console = Console()
+    console = _console()
     
     try:
-        # Write PID file if specified
+        # Write PID file if specified; removed at interpreter exit, including sys.exit()
         if pid_file:
             write_pid_file(pid_file)
+            atexit.register(remove_pid_file, pid_file)
         
         # Create and setup scheduler
         console.print("[cyan]Initializing scheduler...[/cyan]")
-        collector = ScheduledCollector(config_path)
+        collector = ScheduledCollector(config)
         collector.setup_jobs()
         
         # Setup signal handlers
-        setup_signal_handlers(collector)
+        setup_signal_handlers(collector, config_path)
         
         # Start scheduler
         console.print("[green]Starting scheduler...[/green]")
         collector.start()
         
-        # Display schedule info
+        # Display schedule info; one status snapshot serves the table and the banner
+        status = collector.get_status()
         console.print()
-        display_schedule_info(collector)
+        display_schedule_info(collector, status)
         console.print()
-        console.print("[bold green]Scheduler is running. Press Ctrl+C to stop.[/bold green]")
+        console.print(
+            f"[bold green]Scheduler is running with {len(status['jobs'])} jobs. "
+            "Press Ctrl+C to stop.[/bold green]"
+        )
         
         # Run forever (blocking)
-        collector.run_forever()
+        collector.run_forever(handle_signals=False)
         
     except KeyboardInterrupt:
         console.print("\n[yellow]Received interrupt signal, shutting down...[/yellow]")
     except Exception as e:
         console.print(f"[red]Scheduler failed: {e}[/red]")
-        logging.error(f"Scheduler error: {e}", exc_info=True)
+        logger.error("Scheduler error: %s", e, exc_info=True)
         sys.exit(1)
-    finally:
-        # Clean up PID file
-        if pid_file:
-            remove_pid_file(pid_file)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,219 @@
+"""
+Randomized checks of the packed coverage kernels against set-based references.
+
+Run with: python -m unittest discover -s src/image_collector/tests
+"""
+
+import itertools
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import shapely
+from shapely.geometry import box
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import coverage_optimizer as co  # noqa: E402
+
+
+def make_instance(rng, grid_size, num_large, num_small, with_quadrants=False):
+    """Random box footprints over a square grid of sample points, with their coverage sets."""
+    spacing = 100.0 / grid_size
+    axis = (np.arange(grid_size) + 0.5) * spacing
+    xs, ys = (a.ravel() for a in np.meshgrid(axis, axis))
+
+    # The four quadrants together cover every point, so any target is reachable
+    footprints = []
+    if with_quadrants:
+        footprints = [box(x0, y0, x0 + 50.0, y0 + 50.0) for x0 in (0.0, 50.0) for y0 in (0.0, 50.0)]
+    # Large boxes give dense rows, small ones sparse rows (below _DENSE_ROW_MIN_DENSITY)
+    for side_range, count in (((30.0, 70.0), num_large), ((4.0, 12.0), num_small)):
+        for _ in range(count):
+            side = rng.uniform(*side_range)
+            x0, y0 = rng.uniform(0.0, 100.0 - side, size=2)
+            footprints.append(box(x0, y0, x0 + side, y0 + side))
+    order = rng.permutation(len(footprints))
+    footprints = [footprints[i] for i in order]
+
+    coverage_sets = [
+        set(np.flatnonzero(shapely.contains_xy(footprint, xs, ys)).tolist())
+        for footprint in footprints
+    ]
+    return xs, ys, footprints, coverage_sets
+
+
+def make_candidates(footprints, coverage_sets, cloud_covers, quality_scores):
+    return [
+        co.CoverageCandidate(
+            index=j,
+            footprint=footprint,
+            cloud_cover=float(cloud_covers[j]),
+            date="2024-01-01",
+            quality_score=float(quality_scores[j]),
+            covered_points=coverage_sets[j],
+        )
+        for j, footprint in enumerate(footprints)
+    ]
+
+
+def reference_greedy(candidates, coverage_sets, num_points, min_coverage_fraction,
+                     cloud_weight, quality_weight):
+    """The original set-based greedy loop."""
+    uncovered_points = set(range(num_points))
+    selected_indices = []
+    target_points = int(num_points * min_coverage_fraction)
+    while len(uncovered_points) > (num_points - target_points):
+        best_candidate_idx = None
+        best_gain_per_cost = 0
+        for j, candidate in enumerate(candidates):
+            if j in selected_indices:
+                continue
+            marginal_gain = len(coverage_sets[j] & uncovered_points)
+            if marginal_gain == 0:
+                continue
+            cost = max(
+                cloud_weight * candidate.cloud_cover / 100.0
+                + quality_weight * (1.0 - candidate.quality_score),
+                0.01,
+            )
+            gain_per_cost = marginal_gain / cost
+            if gain_per_cost > best_gain_per_cost:
+                best_gain_per_cost = gain_per_cost
+                best_candidate_idx = j
+        if best_candidate_idx is None:
+            break
+        selected_indices.append(best_candidate_idx)
+        uncovered_points -= coverage_sets[best_candidate_idx]
+    return selected_indices
+
+
+class MarginalGainsTest(unittest.TestCase):
+    def test_dense_and_sparse_rows_match_set_intersections(self):
+        rng = np.random.default_rng(0)
+        # 90 dense rows reach the threaded path when Numba is missing
+        _, _, _, coverage_sets = make_instance(rng, grid_size=37, num_large=90, num_small=40)
+        num_points = 37 * 37
+        rows = co._split_coverage(coverage_sets, num_points)
+        self.assertGreater(len(rows.dense_ids), 0)
+        self.assertGreater(len(rows.sparse_ids), 0)
+
+        with co.ThreadPoolExecutor(max_workers=2) as executor:
+            for _ in range(5):
+                uncov_mask = rng.random(num_points) < 0.6
+                uncovered = set(np.flatnonzero(uncov_mask).tolist())
+                expected = [len(cov_set & uncovered) for cov_set in coverage_sets]
+                for pool in (None, executor):
+                    gains = co._marginal_gains(rows, uncov_mask, pool)
+                    self.assertEqual(gains.tolist(), expected)
+
+        for j, cov_set in enumerate(coverage_sets):
+            self.assertEqual(sorted(co._row_points(rows, j).tolist()), sorted(cov_set))
+
+
+class GreedySetCoverTest(unittest.TestCase):
+    def test_matches_reference_greedy(self):
+        # Costs are powers of two, so gain-per-cost ratios are exact in both the
+        # float32 kernel and the float64 reference and ties break identically
+        quality_levels = np.array([0.0, 0.5, 0.75, 0.875])
+        for seed in range(6):
+            rng = np.random.default_rng(seed)
+            xs, ys, footprints, coverage_sets = make_instance(
+                rng, grid_size=40, num_large=int(rng.integers(5, 80)), num_small=int(rng.integers(5, 60))
+            )
+            num_points = len(xs)
+            candidates = make_candidates(
+                footprints,
+                coverage_sets,
+                cloud_covers=rng.uniform(0, 100, len(footprints)),
+                quality_scores=rng.choice(quality_levels, len(footprints)),
+            )
+            for min_coverage_fraction in (1.0, 0.9, 0.6):
+                expected = reference_greedy(
+                    candidates, coverage_sets, num_points, min_coverage_fraction, 0.0, 1.0
+                )
+                covered = set().union(*(coverage_sets[j] for j in expected))
+                for sample_xs, sample_ys in ((None, None), (xs, ys)):
+                    with self.subTest(seed=seed, target=min_coverage_fraction,
+                                      bbox_pruning=sample_xs is not None):
+                        result = co.greedy_set_cover(
+                            candidates, coverage_sets, num_points, 1e6,
+                            min_coverage_fraction, 0.0, 1.0,
+                            sample_xs=sample_xs, sample_ys=sample_ys,
+                        )
+                        self.assertEqual(result.selected_indices, expected)
+                        self.assertAlmostEqual(result.coverage_fraction, len(covered) / num_points)
+
+
+class AggregatePointColumnsTest(unittest.TestCase):
+    def test_groups_points_by_covering_candidates(self):
+        rng = np.random.default_rng(1)
+        # Sizes that are not multiples of 8 exercise the packed padding bits
+        num_points, num_candidates = 203, 13
+        coverage_sets = [
+            set(np.flatnonzero(rng.random(num_points) < p).tolist())
+            for p in rng.uniform(0.02, 0.4, num_candidates)
+        ]
+        group_candidates, group_sizes = co._aggregate_point_columns(
+            co._pack_coverage(coverage_sets, num_points), num_candidates
+        )
+
+        expected = {}
+        for point in range(num_points):
+            covering = tuple(j for j, cov_set in enumerate(coverage_sets) if point in cov_set)
+            if covering:
+                expected[covering] = expected.get(covering, 0) + 1
+        actual = {
+            tuple(covering.tolist()): int(size)
+            for covering, size in zip(group_candidates, group_sizes)
+        }
+        self.assertEqual(actual, expected)
+
+
+@unittest.skipUnless(co.ORTOOLS_AVAILABLE, "OR-Tools not installed")
+class OptimalSetCoverMilpTest(unittest.TestCase):
+    def test_matches_brute_force_optimum(self):
+        cloud_weight, quality_weight, epsilon = 0.3, 0.7, 1e-6
+        for seed in range(4):
+            rng = np.random.default_rng(seed)
+            xs, _, footprints, coverage_sets = make_instance(
+                rng, grid_size=14, num_large=4, num_small=4, with_quadrants=True
+            )
+            num_points = len(xs)
+            candidates = make_candidates(
+                footprints,
+                coverage_sets,
+                cloud_covers=rng.uniform(0, 100, len(footprints)),
+                quality_scores=rng.uniform(0, 1, len(footprints)),
+            )
+            costs = [
+                max(cloud_weight * c.cloud_cover / 100.0 + quality_weight * (1.0 - c.quality_score), 0.01)
+                + epsilon
+                for c in candidates
+            ]
+            for min_coverage_fraction in (1.0, 0.8, 0.5):
+                target_points = int(num_points * min_coverage_fraction)
+                feasible_costs = [
+                    sum(costs[j] for j in subset)
+                    for r in range(len(candidates) + 1)
+                    for subset in itertools.combinations(range(len(candidates)), r)
+                    if len(set().union(*(coverage_sets[j] for j in subset))) >= target_points
+                ]
+                with self.subTest(seed=seed, target=min_coverage_fraction):
+                    result = co.optimal_set_cover_milp(
+                        candidates, coverage_sets, num_points, 1e6,
+                        min_coverage_fraction, cloud_weight, quality_weight,
+                        time_limit_seconds=30,
+                    )
+                    self.assertIsNotNone(result)
+                    self.assertTrue(result.optimal)
+                    covered = set().union(*(coverage_sets[j] for j in result.selected_indices))
+                    self.assertGreaterEqual(len(covered), target_points)
+                    self.assertAlmostEqual(
+                        sum(costs[j] for j in result.selected_indices), min(feasible_costs), places=6
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,51 +3,78 @@ import logging
 import os
 import sys
 import re
+import hashlib
+import shutil
 from pathlib import Path
 import glob
-import rasterio
-from rasterio.mask import mask
-from rasterio.features import shapes
-import geopandas as gpd
+import queue
+import threading
+from contextlib import nullcontext
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+# rasterio, geopandas, scikit-image and pyproj are imported where they are
+# used, so --help and the early exits in main() don't pay for GDAL/PROJ setup
 import numpy as np
-from shapely.geometry import shape, LineString, MultiPolygon, Point
+import shapely
+from shapely.geometry import shape, LineString, MultiPolygon
 from shapely.geometry import Polygon as ShapelyPolygon
-from shapely.ops import unary_union
-from skimage.filters import threshold_minimum
-from skimage.measure import find_contours
+from shapely.ops import unary_union, transform as transform_geometry
 from rich.console import Console
 from rich.table import Table
 from rich import box
 from rich.panel import Panel
 from rich.rule import Rule
 from rich.prompt import Prompt, IntPrompt
-from rich.status import Status
+from rich.text import Text
 
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR / "data"
 AOI_DIR = DATA_DIR / "json"
 IMG_DIR = DATA_DIR / "img"
 OUTPUT_DIR = SCRIPT_DIR / "output"
+# Finished extractions, reused when the same inputs and thresholds come back.
+# SATSHOR_CACHE_DIR overrides the location; --no_cache turns the cache off.
+CACHE_DIR_ENV = "SATSHOR_CACHE_DIR"
+CACHE_DIR = Path(
+    os.environ.get(CACHE_DIR_ENV)
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "satshor"
+)
+# Cached extractions kept; the least recently used are evicted first
+CACHE_MAX_ENTRIES = 32
+# Rows of the clipped band read per strip; bounds the band data held in memory
+READ_CHUNK_ROWS = 1024
+# Large enough that the second (threshold) pass is served from GDAL's block cache
+GDAL_CACHE_MAX_MB = 2048
+# Set to a non-empty value other than "0" to disable the extraction spinner
+NO_SPINNER_ENV = "SATSHOR_NO_SPINNER"
+S2_TILE_RE = re.compile(r'T(\d{2})([A-Z]{3})')
 console = Console()
+# Stateless renderables shared by every run, so their markup is parsed once.
+# The rules are only drawn on a terminal; redirected output stays flat text.
+_RULE_PROCESSING = Rule("[bold cyan]Processing[/]")
+_RULE_COMPLETE = Rule("[bold green]Extraction Complete[/]")
+_STATUS_MSG = "[yellow]Extracting shoreline...[/yellow] This may take a few moments."
 
 
 def detect_sentinel2_crs(file_path):
-    utm_zone_match = re.search(r'T(\d{2})([A-Z]{3})', file_path)
+    from rasterio.crs import CRS
+
+    utm_zone_match = S2_TILE_RE.search(file_path)
     if utm_zone_match:
         zone_number = utm_zone_match.group(1)
         zone_letter = utm_zone_match.group(2)[0]  
         is_northern = zone_letter in ['N', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X']
 
         if is_northern:
-            epsg_code = f"EPSG:326{zone_number}"
+            epsg_num = int(f"326{zone_number}")
             logging.info(f"Extracted UTM zone {zone_number}N from path")
         else:
-            epsg_code = f"EPSG:327{zone_number}"
+            epsg_num = int(f"327{zone_number}")
             logging.info(f"Extracted UTM zone {zone_number}S from path")
+        epsg_code = f"EPSG:{epsg_num}"
 
         try:
-            import rasterio.crs
-            crs = rasterio.crs.CRS.from_string(epsg_code)
+            crs = CRS.from_epsg(epsg_num)
             logging.info(f"Set CRS to {epsg_code} for Sentinel-2 L2A product")
             return crs
         except Exception as e:
@@ -58,7 +85,17 @@ def detect_sentinel2_crs(file_path):
     logging.warning("Could not extract UTM zone from Sentinel-2 file path")
     return None
 
+@lru_cache(maxsize=32)
+def get_transformer(src_crs, dst_crs):
+    from pyproj import Transformer
+
+    # Keyed on CRS strings so batch runs over a fixed AOI reuse one transformer
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
 def load_aoi(aoi_path):
+    import geopandas as gpd
+
     logging.info(f"Loading AOI: {aoi_path}")
     try:
         aoi_gdf = gpd.read_file(aoi_path)
@@ -105,61 +142,170 @@ def load_aoi(aoi_path):
     logging.info(f"AOI loaded successfully with CRS: {aoi_gdf.crs}")
     return aoi_gdf.crs, aoi_geom
 
-def apply_threshold(data, method="minimum"):
-    valid_data = data[~np.isnan(data) & (data > 0)]
-    if valid_data.size == 0:
+def counted_per_level(dtype):
+    return dtype.kind == "u" and dtype.itemsize <= 2
+
+
+def level_histogram(level_counts, nbins=256):
+    # Histogram of an integer band from its per-level counts, with the bins
+    # band_histogram would use on the values themselves
+    levels = np.flatnonzero(level_counts)
+    lo, hi = int(levels[0]), int(levels[-1])
+    hist, edges = np.histogram(
+        np.arange(lo, hi + 1, dtype=np.float64),
+        bins=nbins,
+        range=(float(lo), float(hi)),
+        weights=level_counts[lo : hi + 1],
+    )
+    return hist, (edges[:-1] + edges[1:]) / 2
+
+
+def band_histogram(values, nbins=256):
+    # Same bins as skimage's histogram of a float image: nbins over [min, max].
+    # Integer bands are counted per level first, so only the levels are binned.
+    if counted_per_level(values.dtype):
+        return level_histogram(np.bincount(values), nbins)
+    lo, hi = values.min(), values.max()
+    hist, edges = np.histogram(values, bins=nbins, range=(float(lo), float(hi)))
+    return hist, (edges[:-1] + edges[1:]) / 2
+
+
+def raise_if_cancelled(cancel_event):
+    # Cancellation unwinds as KeyboardInterrupt, which the broad
+    # `except Exception` handlers in extract_shoreline let through
+    if cancel_event is not None and cancel_event.is_set():
+        raise KeyboardInterrupt
+
+
+def iter_band_chunks(
+    src, window, outside, nodata, chunk_rows=READ_CHUNK_ROWS, cancel_event=None
+):
+    from rasterio.windows import Window
+
+    # Read band 1 over the clipped window a strip of rows at a time; pixels
+    # outside the AOI or equal to nodata are marked invalid
+    # 2-D reads straight into one reused strip buffer; each strip is only
+    # valid until the next one is requested
+    height, width = outside.shape
+    row_off, col_off = int(window.row_off), int(window.col_off)
+    data_buf = np.empty((min(chunk_rows, height), width), dtype=src.dtypes[0])
+    valid_buf = np.empty(data_buf.shape, dtype=bool)
+    for start in range(0, height, chunk_rows):
+        raise_if_cancelled(cancel_event)
+        stop = min(start + chunk_rows, height)
+        data = src.read(
+            1,
+            window=Window(col_off, row_off + start, width, stop - start),
+            out=data_buf[: stop - start],
+        )
+        valid = np.not_equal(data, nodata, out=valid_buf[: stop - start])
+        valid &= ~outside[start:stop]
+        yield slice(start, stop), data, valid
+
+
+def apply_threshold(read_chunks, shape, method="minimum"):
+    from skimage.filters import threshold_minimum
+
+    # read_chunks() yields (rows, data, valid) strips covering `shape`. The band
+    # is streamed twice, once into the histogram and once through the threshold,
+    # so only the boolean mask is ever held for the whole scene.
+    level_counts = None
+    value_parts = []
+    for _, data, valid in read_chunks():
+        values = data[valid & (data > 0)]
+        if counted_per_level(values.dtype):
+            counts = np.bincount(values, minlength=np.iinfo(values.dtype).max + 1)
+            if level_counts is None:
+                level_counts = counts
+            else:
+                level_counts += counts
+        else:
+            value_parts.append(values)
+    if level_counts is not None and level_counts.any():
+        hist = level_histogram(level_counts)
+    elif sum(part.size for part in value_parts):
+        hist = band_histogram(np.concatenate(value_parts))
+    else:
         logging.error("No valid data found after masking for thresholding.")
         return None, None
     threshold_value = None
     try:
-        threshold_value = threshold_minimum(valid_data)
+        threshold_value = threshold_minimum(hist=hist)
     except RuntimeError as e:
         logging.error(f"Minimum threshold failed: {e}")
         return None, None
     logging.info(
         f"Applied 'minimum' threshold. Determined threshold: {threshold_value}"
     )
-    binary_mask = data <= threshold_value
+    binary_mask = np.zeros(shape, dtype=bool)
+    for rows, data, valid in read_chunks():
+        np.logical_and(valid, data <= threshold_value, out=binary_mask[rows])
     return binary_mask, threshold_value
 
+def ring_areas(rings):
+    # Shoelace area of each ring straight from its coordinates, without
+    # promoting the rings to polygons. Coordinates are taken relative to each
+    # ring's first vertex to keep precision with large projected values.
+    if not len(rings):
+        return np.empty(0)
+    coords, index = shapely.get_coordinates(rings, return_index=True)
+    coords = coords - coords[np.searchsorted(index, index)]
+    x, y = coords[:, 0], coords[:, 1]
+    cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+    same_ring = index[:-1] == index[1:]
+    return 0.5 * np.abs(
+        np.bincount(index[:-1][same_ring], weights=cross[same_ring], minlength=len(rings))
+    )
+
+
 def vectorize_mask(
     binary_mask, transform, crs, min_sea_area_m2=10000.0, min_island_area_m2=50000.0
 ):
-    logging.info("Vectorizing all water polygons from mask...")
+    import geopandas as gpd
+    from rasterio.features import shapes
+    from rasterio.windows import Window, transform as window_transform
+    from skimage.measure import label
+
+    logging.info("Vectorizing the largest water body from mask...")
     binary_mask = binary_mask.astype(bool)
-    try:
-        results = list(
-            shapes(
-                binary_mask.astype(np.uint8),
-                mask=binary_mask,
-                transform=transform,
-                connectivity=4,
-            )
-        )
-    except Exception as e:
-        logging.error(f"Error during rasterio.features.shapes: {e}")
-        return None
-    water_polygons_initial = [shape(s) for s, v in results if v == 1]
-    if not water_polygons_initial:
+    # Label 4-connected water regions (the connectivity shapes() uses) and only
+    # vectorize the largest, so small puddles never become polygons
+    labels, num_regions = label(binary_mask, connectivity=1, return_num=True)
+    if num_regions == 0:
         logging.warning("Polygon vectorization resulted in no valid water features.")
         return None
-    logging.info(f"Generated {len(water_polygons_initial)} initial water polygons.")
-    gdf_polygons = gpd.GeoDataFrame({"geometry": water_polygons_initial}, crs=crs)
-    if not gdf_polygons.crs.is_projected:
-        logging.warning(
-            f"CRS '{gdf_polygons.crs}' is not projected. Area calculation might be inaccurate."
-        )
-    gdf_polygons["area"] = gdf_polygons.geometry.area
-    if gdf_polygons.empty:
-        logging.info("No water polygons found after initial vectorization.")
-        return None
-    max_area = gdf_polygons["area"].max()
+    logging.info(f"Found {num_regions} connected water regions.")
+    counts = np.bincount(labels.ravel())
+    counts[0] = 0
+    max_count = counts.max()
+    pixel_area = abs(transform.a * transform.e - transform.b * transform.d)
+    max_area = max_count * pixel_area
     if max_area < min_sea_area_m2:
         logging.warning(
             f"Largest water body area ({max_area:.2f} m^2) is below threshold ({min_sea_area_m2} m^2). No significant sea polygon found."
         )
         return None
-    largest_polygons = gdf_polygons[gdf_polygons["area"] == max_area]
+    main_mask = np.isin(labels, np.flatnonzero(counts == max_count))
+    # Only the bounding box of the largest region is handed to shapes()
+    rows = np.flatnonzero(main_mask.any(axis=1))
+    cols = np.flatnonzero(main_mask.any(axis=0))
+    bbox = Window(cols[0], rows[0], cols[-1] - cols[0] + 1, rows[-1] - rows[0] + 1)
+    main_mask = main_mask[rows[0] : rows[-1] + 1, cols[0] : cols[-1] + 1]
+    try:
+        # Plain shapely polygons; a GeoDataFrame is only built for the result
+        largest_polygons = [
+            shape(s)
+            for s, v in shapes(
+                main_mask.astype(np.uint8),
+                mask=main_mask,
+                transform=window_transform(bbox, transform),
+                connectivity=4,
+            )
+            if v == 1
+        ]
+    except Exception as e:
+        logging.error(f"Error during rasterio.features.shapes: {e}")
+        return None
     logging.info(
         f"Found {len(largest_polygons)} polygon(s) with max area {max_area:.2f} m^2 (threshold: {min_sea_area_m2} m^2). Assuming this is the main sea body."
     )
@@ -167,7 +313,7 @@ def vectorize_mask(
     total_interiors_found = 0
     kept_interiors = 0
     logging.info(f"Filtering islands with area < {min_island_area_m2} m^2...")
-    for geom in largest_polygons.geometry:
+    for geom in largest_polygons:
         if not geom.is_valid:
             logging.warning(
                 f"Largest polygon geometry is invalid, attempting buffer(0) fix."
@@ -179,17 +325,9 @@ def vectorize_mask(
                 )
                 continue
         if geom.geom_type == "Polygon":
-            shoreline_lines.append(geom.exterior)
-            total_interiors_found += len(geom.interiors)
-            for interior in geom.interiors:
-                try:
-                    island_poly = ShapelyPolygon(interior)
-                    if island_poly.is_valid and island_poly.area >= min_island_area_m2:
-                        shoreline_lines.append(interior)
-                        kept_interiors += 1
-                except Exception as e:
-                    logging.warning(f"Could not process an interior ring (island): {e}")
+            polygons = [geom]
         elif geom.geom_type == "MultiPolygon":
+            polygons = []
             for poly in geom.geoms:
                 if not poly.is_valid:
                     logging.warning(
@@ -201,21 +339,19 @@ def vectorize_mask(
                             "Buffer(0) failed to fix invalid part. Skipping this part."
                         )
                         continue
-                shoreline_lines.append(poly.exterior)
-                total_interiors_found += len(poly.interiors)
-                for interior in poly.interiors:
-                    try:
-                        island_poly = ShapelyPolygon(interior)
-                        if (
-                            island_poly.is_valid
-                            and island_poly.area >= min_island_area_m2
-                        ):
-                            shoreline_lines.append(interior)
-                            kept_interiors += 1
-                    except Exception as e:
-                        logging.warning(
-                            f"Could not process an interior ring (island): {e}"
-                        )
+                polygons.append(poly)
+        else:
+            continue
+        for poly in polygons:
+            shoreline_lines.append(poly.exterior)
+            # Interiors of a valid polygon are valid rings, so only their area is checked
+            interiors = list(poly.interiors)
+            total_interiors_found += len(interiors)
+            areas = ring_areas(interiors)
+            for interior, area in zip(interiors, areas):
+                if area >= min_island_area_m2:
+                    shoreline_lines.append(interior)
+                    kept_interiors += 1
     if not shoreline_lines:
         logging.warning(
             "Could not extract any shoreline features (exterior/interiors) from the largest water polygon(s) or no islands met the area threshold."
@@ -225,18 +361,70 @@ def vectorize_mask(
         f"Found {total_interiors_found} total island candidates. Kept {kept_interiors} islands with area >= {min_island_area_m2} m^2."
     )
     raw_shorelines_gdf = gpd.GeoDataFrame({"geometry": shoreline_lines}, crs=crs)
+    if not raw_shorelines_gdf.crs.is_projected:
+        logging.warning(
+            f"CRS '{raw_shorelines_gdf.crs}' is not projected. Area calculation might be inaccurate."
+        )
     logging.info(
         f"Extracted {len(raw_shorelines_gdf)} raw shoreline features (coastline + filtered islands) from largest water body."
     )
     return raw_shorelines_gdf
 
 
-def apply_subpixel_refinement(binary_mask, transform, shorelines_gdf, aoi_polygon):
+def contours_to_world(contours, transform):
+    # find_contours yields (row, col) pairs; apply the affine to each contour at
+    # once, with the coefficients read from the transform a single time
+    ta, tb, tc = transform.a, transform.b, transform.c
+    td, te, tf = transform.d, transform.e, transform.f
+    world_contours = []
+    for contour in contours:
+        if len(contour) < 2:
+            continue
+        rows = contour[:, 0]
+        cols = contour[:, 1]
+        world = np.empty((len(contour), 2))
+        world[:, 0] = ta * cols + tb * rows + tc
+        world[:, 1] = td * cols + te * rows + tf
+        world_contours.append(world)
+    return world_contours
+
+
+def pixel_window(bounds, transform, shape, pad=1):
+    # Row/column slices of the raster covering world-space bounds, padded by
+    # `pad` pixels so marching squares sees both sides of the edge pixels
+    inverse = ~transform
+    minx, miny, maxx, maxy = bounds
+    cols, rows = zip(*(inverse * (x, y) for x in (minx, maxx) for y in (miny, maxy)))
+    r0 = max(int(np.floor(min(rows))) - pad, 0)
+    r1 = min(int(np.ceil(max(rows))) + pad + 1, shape[0])
+    c0 = max(int(np.floor(min(cols))) - pad, 0)
+    c1 = min(int(np.ceil(max(cols))) + pad + 1, shape[1])
+    return slice(r0, r1), slice(c0, c1)
+
+
+def combined_scores(dist_scores, lengths, orig_length):
+    # Hausdorff distance plus 100x the relative length mismatch, built in one
+    # buffer rather than a temporary per operation
+    scores = np.subtract(lengths, orig_length)
+    np.abs(scores, out=scores)
+    scores /= max(orig_length, 1.0)
+    scores *= 100
+    scores += dist_scores
+    return scores
+
+
+def apply_subpixel_refinement(
+    binary_mask,
+    transform,
+    shorelines_gdf,
+    aoi_polygon,
+    cancel_event=None,
+    max_workers=None,
+):
+    import geopandas as gpd
+    from skimage.measure import find_contours
+
     logging.info("Applying subpixel refinement using marching squares method...")
-    contours = find_contours(binary_mask.astype(float), 0.5)
-    if not contours:
-        logging.warning("No contours found during subpixel refinement.")
-        return shorelines_gdf
     minx, miny, maxx, maxy = aoi_polygon.bounds
     width_deg = maxx - minx
     height_deg = maxy - miny
@@ -269,36 +457,57 @@ def apply_subpixel_refinement(binary_mask, transform, shorelines_gdf, aoi_polygo
         logging.info(
             f"Created manual inner rectangle with {shrink_factor*100}% shrinkage from each edge."
         )
-    final_lines = []
-    for orig_line in shorelines_gdf.geometry:
+    shapely.prepare(inner_polygon)
+
+    def match_contour(orig_line):
+        # Trace contours only in the part of the mask around this shoreline's
+        # 50 m buffer; threads share the mask read-only
+        raise_if_cancelled(cancel_event)
         orig_buffer = orig_line.buffer(50.0)
-        best_contour = None
-        best_score = float("inf")
-        for contour in contours:
-            world_coords = []
-            for point in contour:
-                y, x = point[0], point[1]
-                world_x, world_y = transform * (x, y)
-                world_coords.append((world_x, world_y))
-            if len(world_coords) < 2:
-                continue
-            temp_line = LineString(world_coords)
-            if not temp_line.intersects(orig_buffer):
-                continue
-            dist_score = orig_line.hausdorff_distance(temp_line)
-            length_ratio = abs(temp_line.length - orig_line.length) / max(
-                orig_line.length, 1.0
-            )
-            combined_score = dist_score + (length_ratio * 100)
-            if combined_score < best_score:
-                best_score = combined_score
-                best_contour = world_coords
-        if best_contour and len(best_contour) >= 2:
-            filtered_coords = []
-            for point in best_contour:
-                point_geom = Point(point)
-                if inner_polygon.contains(point_geom):
-                    filtered_coords.append(point)
+        rows, cols = pixel_window(orig_buffer.bounds, transform, binary_mask.shape)
+        sub_mask = binary_mask[rows, cols]
+        if sub_mask.size == 0:
+            return None
+        # float32 is exact for the 0.5 level set of a boolean mask
+        contours = find_contours(sub_mask.astype(np.float32), 0.5)
+        offset = np.array([rows.start, cols.start])
+        contour_coords = contours_to_world(
+            [contour + offset for contour in contours], transform
+        )
+        if not contour_coords:
+            return None
+        contour_lines = np.array(
+            [LineString(coords) for coords in contour_coords], dtype=object
+        )
+        candidate_idx = np.flatnonzero(shapely.intersects(orig_buffer, contour_lines))
+        if not len(candidate_idx):
+            return None
+        # Score all candidates with one GEOS call
+        candidates = contour_lines[candidate_idx]
+        scores = combined_scores(
+            shapely.hausdorff_distance(orig_line, candidates),
+            shapely.length(candidates),
+            orig_line.length,
+        )
+        best = np.argmin(scores)
+        if scores[best] < float("inf"):
+            return contour_coords[candidate_idx[best]]
+        return None
+
+    orig_lines = list(shorelines_gdf.geometry)
+    # max_workers defaults to one thread per CPU; --batch workers pass their share
+    max_workers = min(max_workers or os.cpu_count() or 1, len(orig_lines))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            best_contours = list(executor.map(match_contour, orig_lines))
+    else:
+        best_contours = [match_contour(orig_line) for orig_line in orig_lines]
+
+    final_lines = []
+    for orig_line, best_contour in zip(orig_lines, best_contours):
+        if best_contour is not None and len(best_contour) >= 2:
+            inside = shapely.contains_xy(inner_polygon, best_contour[:, 0], best_contour[:, 1])
+            filtered_coords = best_contour[inside]
             if len(filtered_coords) >= 2:
                 refined_line = LineString(filtered_coords)
                 final_lines.append(refined_line)
@@ -324,7 +533,21 @@ def extract_shoreline(
     output_path,
     min_sea_area_m2=10000.0,
     min_island_area_m2=50000.0,
+    on_stage=None,
+    cancel_event=None,
+    refine_workers=None,
 ):
+    import geopandas as gpd
+    import rasterio
+    from rasterio.mask import raster_geometry_mask
+
+    # on_stage(message) is called as each processing stage starts. Setting
+    # cancel_event stops the run at the next stage, band strip or shoreline.
+    def report_stage(message):
+        raise_if_cancelled(cancel_event)
+        if on_stage is not None:
+            on_stage(message)
+
     logging.info(
         f"Starting shoreline extraction for file {b8_file_path} using AOI {aoi_path}"
     )
@@ -332,21 +555,25 @@ def extract_shoreline(
     logging.info(
         f"Filtering strategy: Shorelines from largest water body (min area: {min_sea_area_m2} m^2), islands filtered (min area: {min_island_area_m2} m^2), clipped to AOI."
     )
+    # Paths may be str or PathLike; only the tile-name regex needs a string
     if not Path(b8_file_path).is_file():
         logging.error(f"Input Band 8 file not found: {b8_file_path}")
         return
+    report_stage("Loading AOI...")
     aoi_crs, aoi_geom = load_aoi(aoi_path)
     if aoi_geom is None:
         return
     try:
-        with rasterio.open(b8_file_path) as src:
+        with rasterio.Env(GDAL_CACHEMAX=GDAL_CACHE_MAX_MB), rasterio.open(
+            b8_file_path
+        ) as src:
             logging.info(f"Opened raster: {b8_file_path}")
             raster_crs = src.crs
             nodata_val = src.nodata
 
             if raster_crs is None:
                 logging.warning("Raster CRS is None. This is a Sentinel-2 L2A product, setting appropriate UTM CRS.")
-                raster_crs = detect_sentinel2_crs(b8_file_path)
+                raster_crs = detect_sentinel2_crs(os.fspath(b8_file_path))
 
                 if raster_crs is None:
                     logging.error("Failed to detect CRS from Sentinel-2 file path. Cannot proceed.")
@@ -358,9 +585,6 @@ def extract_shoreline(
             if aoi_crs != raster_crs:
                 logging.info(f"Reprojecting AOI from {aoi_crs} to {raster_crs}")
                 try:
-                    # Create a GeoDataFrame with the AOI geometry
-                    aoi_gdf = gpd.GeoDataFrame([1], geometry=[aoi_geom], crs=aoi_crs)
-
                     # Handle both CRS object and dictionary format
                     if isinstance(raster_crs, dict) and 'init' in raster_crs:
                         # For dictionary format CRS
@@ -368,26 +592,15 @@ def extract_shoreline(
                         if epsg_code.startswith('EPSG:'):
                             epsg_num = int(epsg_code.split(':')[1])
                             logging.info(f"Using EPSG code {epsg_num} for reprojection")
-                            aoi_gdf_proj = aoi_gdf.to_crs(epsg=epsg_num)
+                            target_crs = f"EPSG:{epsg_num}"
                         else:
                             logging.warning(f"Unsupported CRS format: {raster_crs}")
                             raise ValueError(f"Unsupported CRS format: {raster_crs}")
                     else:
-                        aoi_gdf_proj = aoi_gdf.to_crs(raster_crs)
+                        target_crs = raster_crs.to_string()
 
-                    try:
-                        aoi_geom_proj = aoi_gdf_proj.geometry.union_all()
-                    except AttributeError:
-                        logging.warning(
-                            "'.union_all()' method not found, trying older '.unary_union' attribute for reprojection."
-                        )
-                        try:
-                            aoi_geom_proj = aoi_gdf_proj.geometry.unary_union
-                        except Exception as e:
-                            logging.error(
-                                f"Failed to combine reprojected AOI geometries: {e}"
-                            )
-                            return
+                    transformer = get_transformer(aoi_crs.to_string(), target_crs)
+                    aoi_geom_proj = transform_geometry(transformer.transform, aoi_geom)
                 except Exception as e:
                     logging.warning(f"AOI reprojection failed: {e}")
                     logging.warning("AOI geometry is invalid or became empty after projection. Creating a fallback polygon.")
@@ -430,16 +643,15 @@ def extract_shoreline(
                     )
                     return
 
+            report_stage("Clipping Band 8 raster to AOI...")
             logging.info("Clipping Band 8 raster to AOI...")
             try:
-                out_image, out_transform = mask(
+                outside, out_transform, window = raster_geometry_mask(
                     src,
                     [aoi_geom_proj],
                     crop=True,
                     all_touched=True,
-                    nodata=nodata_val if nodata_val is not None else 0,
                 )
-                out_meta = src.meta.copy()
             except ValueError as e:
                 logging.error(
                     f"Error during raster masking. Check AOI overlap with raster bounds ({src.bounds}): {e}"
@@ -449,25 +661,18 @@ def extract_shoreline(
                 logging.error(f"An unexpected error occurred during masking: {e}")
                 return
 
-            out_meta.update(
-                {
-                    "driver": "GTiff",
-                    "height": out_image.shape[1],
-                    "width": out_image.shape[2],
-                    "transform": out_transform,
-                    "crs": raster_crs,
-                    "nodata": nodata_val if nodata_val is not None else 0,
-                }
+            # The clipped band is streamed in strips of its native dtype;
+            # nodata is tracked as a mask
+            read_chunks = partial(
+                iter_band_chunks,
+                src,
+                window,
+                outside,
+                nodata_val if nodata_val is not None else 0,
+                cancel_event=cancel_event,
             )
-
-            clipped_b8_data = out_image[0].astype(float)
-            current_nodata = out_meta["nodata"]
-            if current_nodata is not None:
-                clipped_b8_data[clipped_b8_data == current_nodata] = np.nan
-            else:
-                clipped_b8_data[clipped_b8_data == 0] = np.nan
-
-            binary_mask, _ = apply_threshold(clipped_b8_data)
+            report_stage("Thresholding water mask...")
+            binary_mask, _ = apply_threshold(read_chunks, outside.shape)
             if binary_mask is None:
                 logging.error("Thresholding failed, cannot proceed.")
                 return
@@ -475,10 +680,11 @@ def extract_shoreline(
             logging.info(
                 f"Vectorizing mask to find largest sea body (min area {min_sea_area_m2} m^2) and filter islands (min area {min_island_area_m2} m^2)..."
             )
+            report_stage("Vectorizing largest water body...")
             raw_shorelines_gdf = vectorize_mask(
                 binary_mask,
                 out_transform,
-                out_meta["crs"],
+                raster_crs,
                 min_sea_area_m2=min_sea_area_m2,
                 min_island_area_m2=min_island_area_m2,
             )
@@ -492,26 +698,38 @@ def extract_shoreline(
             logging.info(
                 f"Clipping {len(raw_shorelines_gdf)} raw shorelines (coast/filtered islands) to AOI polygon interior..."
             )
-            clipped_lines = []
+            report_stage("Clipping shorelines to AOI...")
             aoi_polygon_for_clipping = aoi_geom_proj
+            raw_lines = np.asarray(raw_shorelines_gdf.geometry.values)
 
-            for line in raw_shorelines_gdf.geometry:
-                if not line.is_valid:
-                    logging.warning(
-                        "Raw shoreline segment is invalid, attempting buffer(0)."
-                    )
-                    line = line.buffer(0)
-                    if not line.geom_type.startswith("LineString"):
-                        logging.warning(
-                            f"Skipping geometry after buffer(0) resulted in non-LineString type: {line.geom_type}"
-                        )
-                        continue
-                clipped = line.intersection(aoi_polygon_for_clipping)
-                if not clipped.is_empty:
-                    if clipped.geom_type == "LineString":
-                        clipped_lines.append(clipped)
-                    elif clipped.geom_type == "MultiLineString":
-                        clipped_lines.extend(list(clipped.geoms))
+            # buffer(0) of a line is an empty polygon, so invalid lines cannot be repaired
+            valid = shapely.is_valid(raw_lines)
+            if not valid.all():
+                logging.warning(
+                    f"Skipping {int((~valid).sum())} invalid raw shoreline segment(s)."
+                )
+            lines = raw_lines[valid]
+            # Prepared predicates decide most lines without an overlay: those
+            # inside the AOI are kept whole, those outside are dropped, and only
+            # lines crossing the boundary are intersected
+            shapely.prepare(aoi_polygon_for_clipping)
+            inside = shapely.contains_properly(aoi_polygon_for_clipping, lines)
+            crossing = ~inside & shapely.intersects(aoi_polygon_for_clipping, lines)
+            clipped = lines.copy()
+            if inside.any():
+                # Rings come back from an overlay as LineStrings; match that
+                coords, index = shapely.get_coordinates(lines[inside], return_index=True)
+                clipped[inside] = shapely.linestrings(coords, indices=index)
+            clipped[crossing] = shapely.intersection(
+                lines[crossing], aoi_polygon_for_clipping
+            )
+            clipped = clipped[inside | crossing]
+            type_ids = shapely.get_type_id(clipped)
+            is_line = (
+                (type_ids == shapely.GeometryType.LINESTRING)
+                | (type_ids == shapely.GeometryType.MULTILINESTRING)
+            ) & ~shapely.is_empty(clipped)
+            clipped_lines = shapely.get_parts(clipped[is_line])
 
             clipped_shorelines_gdf = gpd.GeoDataFrame(
                 {"geometry": clipped_lines}, crs=raw_shorelines_gdf.crs
@@ -527,18 +745,38 @@ def extract_shoreline(
                 f"{len(clipped_shorelines_gdf)} shoreline features remain after clipping to AOI."
             )
 
+            report_stage("Refining shorelines...")
             final_shorelines_gdf = apply_subpixel_refinement(
-                binary_mask, out_transform, clipped_shorelines_gdf, aoi_geom_proj
+                binary_mask,
+                out_transform,
+                clipped_shorelines_gdf,
+                aoi_geom_proj,
+                cancel_event=cancel_event,
+                max_workers=refine_workers,
             )
 
             logging.info(
                 f"Saving final refined shoreline LineString features to {output_path}..."
             )
-            final_shorelines_gdf.to_file(output_path, driver="GeoJSON")
+            report_stage("Saving shorelines...")
+            # pyogrio writes the features in one batch rather than one by one
+            # through Fiona. The file is written under a temporary name and
+            # renamed, so an interrupted save never leaves a partial GeoJSON.
+            output_path = Path(output_path)
+            tmp_output_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+            try:
+                final_shorelines_gdf.to_file(
+                    tmp_output_path, driver="GeoJSON", engine="pyogrio"
+                )
+                os.replace(tmp_output_path, output_path)
+            except BaseException:
+                tmp_output_path.unlink(missing_ok=True)
+                raise
             logging.info(
                 f"Saved {len(final_shorelines_gdf)} final shoreline LineString features to {output_path}"
             )
             logging.info("Shoreline extraction complete.")
+            return True
 
     except rasterio.RasterioIOError as e:
         logging.error(f"Error opening or reading raster file {b8_file_path}: {e}")
@@ -590,14 +828,15 @@ def select_aoi_file():
                 f"[red]Invalid choice.[/red] Please enter a number between 1 and {len(aoi_files)}."
             )
 
-def find_band8_files():
-    if not IMG_DIR.is_dir():
-        console.print(f"[red]Error:[/red] Image directory not found: {IMG_DIR}")
+def find_band8_files(img_dir=IMG_DIR):
+    img_dir = Path(img_dir)
+    if not img_dir.is_dir():
+        console.print(f"[red]Error:[/red] Image directory not found: {img_dir}")
         return []
     b8_files = []
-    jp2_files = glob.glob(str(IMG_DIR) + "/**/*B08*10m.jp2", recursive=True)
+    jp2_files = glob.glob(str(img_dir) + "/**/*B08*10m.jp2", recursive=True)
     b8_files.extend(jp2_files)
-    tif_files = glob.glob(str(IMG_DIR) + "/**/*B08*10m.tif", recursive=True)
+    tif_files = glob.glob(str(img_dir) + "/**/*B08*10m.tif", recursive=True)
     b8_files.extend(tif_files)
     return sorted(b8_files)
 
@@ -663,7 +902,191 @@ def generate_output_path(b8_file_path, aoi_path):
     output_path = OUTPUT_DIR / output_filename
     return output_path
 
-if __name__ == "__main__":
+def ensure_directory(path):
+    # One mkdir in the common case where the parent exists; the parent chain
+    # is only walked when it is missing
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        # Like mkdir(exist_ok=True), only an existing directory is accepted
+        if not os.path.isdir(path):
+            raise
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+def extraction_cache_path(
+    cache_dir, b8_file_path, aoi_path, min_sea_area_m2, min_island_area_m2
+):
+    # Path, mtime and size of both inputs are a cheap fingerprint; touching or
+    # replacing either file, or changing a threshold, gives a new key
+    fingerprint = []
+    for path in (b8_file_path, aoi_path):
+        st = os.stat(path)
+        fingerprint.append(f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}")
+    fingerprint.append(f"{min_sea_area_m2}:{min_island_area_m2}")
+    key = hashlib.blake2b("|".join(fingerprint).encode(), digest_size=8).hexdigest()
+    return Path(cache_dir) / f"{key}.geojson"
+
+def store_cached_extraction(output_path, cache_path, max_entries=CACHE_MAX_ENTRIES):
+    # Copy to a temporary name first so a cache entry is never half-written
+    try:
+        ensure_directory(cache_path.parent)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(output_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.warning(f"Could not cache extraction result at {cache_path}: {e}")
+        return
+    prune_extraction_cache(cache_path.parent, max_entries)
+
+def prune_extraction_cache(cache_dir, max_entries=CACHE_MAX_ENTRIES):
+    # Entries are touched when reused, so the oldest mtimes are the least
+    # recently used
+    entries = []
+    for entry in Path(cache_dir).glob("*.geojson"):
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    for _, entry in entries[max_entries:]:
+        try:
+            entry.unlink()
+            logging.debug(f"Evicted cached extraction {entry}")
+        except OSError as e:
+            logging.warning(f"Could not evict cached extraction {entry}: {e}")
+
+def configure_logging(log_level, log_file):
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        filename=str(log_file),
+        filemode="a",
+        force=True,
+    )
+
+def extract_one(
+    b8_file_path, aoi_path, min_sea_area_m2, min_island_area_m2, force, refine_workers
+):
+    # --batch worker: runs in its own process, so GDAL handles are never
+    # shared across a fork
+    output_path = generate_output_path(b8_file_path, aoi_path)
+    if output_path.exists() and not force:
+        return output_path, None
+    extracted = extract_shoreline(
+        b8_file_path,
+        aoi_path,
+        output_path,
+        min_sea_area_m2,
+        min_island_area_m2,
+        refine_workers=refine_workers,
+    )
+    return output_path, bool(extracted)
+
+def run_batch(img_dir, aoi_path, args, log_level, log_file):
+    # Extract every Band 8 tile under img_dir in parallel; returns the exit status
+    b8_files = find_band8_files(img_dir)
+    if not b8_files:
+        console.print(
+            f"[red]Error:[/red] No Band 8 files found in {img_dir} (recursive search)."
+        )
+        return 1
+    try:
+        ensure_directory(OUTPUT_DIR)
+    except OSError as e:
+        console.print(
+            f"[red]Error:[/red] Could not create output directory {OUTPUT_DIR}: {e}"
+        )
+        return 1
+    max_workers = min(os.cpu_count() or 1, len(b8_files))
+    # Each worker's refinement threads get an equal share of the CPUs, so the
+    # pool does not run cpu_count threads in every process
+    refine_workers = max(1, (os.cpu_count() or 1) // max_workers)
+    console.print(
+        f"[blue]Processing {len(b8_files)} Band 8 file(s) with {max_workers} worker(s).[/blue]"
+    )
+    if console.is_terminal:
+        console.print(_RULE_PROCESSING)
+    sys.stdout.flush()
+    failed = 0
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=configure_logging,
+        initargs=(log_level, log_file),
+    ) as executor:
+        futures = {
+            executor.submit(
+                extract_one,
+                b8_file,
+                aoi_path,
+                args.min_sea_area_m2,
+                args.min_island_area_m2,
+                args.force,
+                refine_workers,
+            ): b8_file
+            for b8_file in b8_files
+        }
+        for future in as_completed(futures):
+            b8_name = Path(futures[future]).name
+            try:
+                output_path, extracted = future.result()
+            except Exception as e:
+                logging.error(f"Batch extraction failed for {futures[future]}: {e}")
+                extracted, output_path = False, None
+            if extracted is None:
+                console.print(
+                    Text.assemble(("Output exists, skipping:", "yellow"), f" {b8_name}")
+                )
+            elif extracted:
+                console.print(
+                    Text.assemble(("Extracted:", "green"), f" {b8_name} -> {output_path}")
+                )
+            else:
+                failed += 1
+                console.print(
+                    Text.assemble(("Failed:", "red"), f" {b8_name} (see log for details)")
+                )
+    if console.is_terminal:
+        console.print(_RULE_COMPLETE)
+    console.print(f"{len(b8_files) - failed} of {len(b8_files)} Band 8 file(s) processed.")
+    sys.stdout.flush()
+    return 1 if failed else 0
+
+def run_with_status(status, func, *args, **kwargs):
+    # Run func on a worker thread, passing it an on_stage callback whose
+    # messages are shown on the spinner from this thread, and a cancel_event.
+    # Ctrl-C lands here rather than inside GDAL and is re-raised at once: the
+    # worker is a daemon thread, so neither this call nor interpreter exit
+    # waits for it; it stops at its next cancellation check if still running.
+    stages = queue.Queue()
+    cancelled = threading.Event()
+    future = Future()
+
+    def work():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(
+                func(*args, on_stage=stages.put, cancel_event=cancelled, **kwargs)
+            )
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=work, name="extract-shoreline", daemon=True).start()
+    try:
+        while not future.done():
+            try:
+                message = stages.get(timeout=0.25)
+            except queue.Empty:
+                continue
+            if status is not None:
+                status.update(f"[yellow]{message}[/yellow]")
+    except KeyboardInterrupt:
+        cancelled.set()
+        raise
+    return future.result()
+
+def main():
     parser = argparse.ArgumentParser(
         description="Extracts shorelines (coastline and island boundaries) from a Sentinel-2 Band 8 NIR file within a given AOI.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -697,6 +1120,29 @@ if __name__ == "__main__":
         dest="min_island_area_m2",
         help="Minimum area in square meters for an island's shoreline to be included.",
     )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="DIR",
+        help="Extract shorelines from every Band 8 file found under DIR (recursive search), in parallel. Outputs use generated names.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run the extraction even if the output GeoJSON already exists or a cached result is available.",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        type=Path,
+        default=CACHE_DIR,
+        metavar="DIR",
+        help=f"Directory holding the {CACHE_MAX_ENTRIES} most recently used extraction results (also set by {CACHE_DIR_ENV}).",
+    )
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Neither reuse nor store cached extraction results.",
+    )
     parser.add_argument(
         "--loglevel",
         type=str,
@@ -705,19 +1151,25 @@ if __name__ == "__main__":
         help="Set the logging level for console output.",
     )
     args = parser.parse_args()
+    if args.batch and (args.b8_input_file or args.output_geojson):
+        parser.error("--batch cannot be combined with --b8_input_file or --output_geojson")
     log_level = getattr(logging, args.loglevel.upper(), logging.INFO)
     log_dir = SCRIPT_DIR / "logs"
-    log_dir.mkdir(exist_ok=True)
+    ensure_directory(log_dir)
     log_file = log_dir / "shoreline_extractor.log"
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        filename=str(log_file),
-        filemode="a",
-        force=True,
-    )
+    configure_logging(log_level, log_file)
     logging.info(f"Logging level set to {args.loglevel.upper()}")
+    # Block-buffer redirected output; flushed explicitly before the long
+    # extraction and on the way out. Windows is left alone to avoid console
+    # encoding surprises.
+    if not console.is_terminal and sys.platform != "win32":
+        reconfigure = getattr(sys.stdout, "reconfigure", None)
+        if reconfigure is not None:
+            reconfigure(line_buffering=False, write_through=False)
     console.print(Rule("[bold magenta]Shoreline Extractor[/]"))
+    # Informational lines are styled Text rather than markup and are printed
+    # together once the paths are settled
+    info_lines = []
     aoi_path = args.aoi_path
     if not aoi_path:
         console.print(Rule("[bold cyan]Select Area of Interest[/]"))
@@ -725,11 +1177,17 @@ if __name__ == "__main__":
         if not aoi_file:
             console.print("[red]Error:[/red] No AOI file selected. Exiting.")
             sys.exit(1)
+        aoi_path_obj = aoi_file
         aoi_path = str(aoi_file)
     else:
-        console.print(
-            f"[green]Using provided AOI file:[/green] {os.path.basename(aoi_path)}"
+        aoi_path_obj = Path(aoi_path)
+        info_lines.append(
+            Text.assemble(("Using provided AOI file:", "green"), f" {aoi_path_obj.name}")
         )
+    if args.batch:
+        if info_lines:
+            console.print(Text("\n").join(info_lines))
+        sys.exit(run_batch(args.batch, aoi_path_obj, args, log_level, log_file))
     b8_file_path = args.b8_input_file
     if not b8_file_path:
         console.print(Rule("[bold cyan]Select Band 8 File[/]"))
@@ -738,37 +1196,116 @@ if __name__ == "__main__":
             console.print("[red]Error:[/red] No Band 8 file selected. Exiting.")
             sys.exit(1)
         b8_file_path = b8_file
+        b8_path_obj = Path(b8_file)
     else:
-        console.print(
-            f"[green]Using provided Band 8 file:[/green] {os.path.basename(b8_file_path)}"
+        b8_path_obj = Path(b8_file_path)
+        info_lines.append(
+            Text.assemble(("Using provided Band 8 file:", "green"), f" {b8_path_obj.name}")
         )
     output_path = args.output_geojson
     if not output_path:
-        output_path = str(generate_output_path(b8_file_path, aoi_path))
-        console.print(f"[blue]Generated output path:[/blue] {output_path}")
+        output_path = os.fspath(generate_output_path(b8_path_obj, aoi_path_obj))
+        info_lines.append(Text.assemble(("Generated output path:", "blue"), f" {output_path}"))
     else:
-        console.print(f"[blue]Using provided output path:[/blue] {output_path}")
+        info_lines.append(Text.assemble(("Using provided output path:", "blue"), f" {output_path}"))
     output_path_obj = Path(output_path)
     output_dir = output_path_obj.parent
-    try:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        console.print(f"[green]Ensured output directory exists:[/green] {output_dir}")
-    except OSError as e:
-        console.print(
-            f"[red]Error:[/red] Could not create output directory {output_dir}: {e}"
-        )
-        sys.exit(1)
-    console.print(Rule("[bold cyan]Processing[/]"))
-    with Status(
-        "[yellow]Extracting shoreline...[/yellow] This may take a few moments.",
-        spinner="dots",
-    ) as status:
-        extract_shoreline(
-            b8_file_path,
-            aoi_path,
-            output_path,
-            args.min_sea_area_m2,
-            args.min_island_area_m2,
+    # Buffer the lines leading up to the spinner and write them in one go
+    with console:
+        try:
+            ensure_directory(output_dir)
+        except OSError as e:
+            info_lines.append(
+                Text.assemble(
+                    ("Error:", "red"), f" Could not create output directory {output_dir}: {e}"
+                )
+            )
+            console.print(Text("\n").join(info_lines))
+            sys.exit(1)
+        info_lines.append(
+            Text.assemble(("Ensured output directory exists:", "green"), f" {output_dir}")
         )
-    console.print(Rule("[bold green]Extraction Complete[/]"))
-    console.print(f"[green]Shoreline extracted successfully to:[/green] {output_path}")
+        console.print(Text("\n").join(info_lines))
+        if output_path_obj.exists() and not args.force:
+            console.print(
+                Text.assemble(("Output exists, skipping (use --force):", "yellow"), f" {output_path}")
+            )
+            return
+        if console.is_terminal:
+            console.print(_RULE_PROCESSING)
+    cache_path = None
+    if not args.no_cache:
+        try:
+            cache_path = extraction_cache_path(
+                args.cache_dir,
+                b8_path_obj,
+                aoi_path_obj,
+                args.min_sea_area_m2,
+                args.min_island_area_m2,
+            )
+        except OSError:
+            # A missing input is reported by extract_shoreline itself
+            pass
+    reused = False
+    if cache_path is not None and not args.force and cache_path.is_file():
+        # An unreadable cache entry falls through to a normal extraction
+        try:
+            shutil.copyfile(cache_path, output_path)
+        except OSError as e:
+            logging.warning(f"Could not reuse cached extraction {cache_path}: {e}")
+        else:
+            reused = True
+            # Mark the entry as recently used so eviction keeps it
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            logging.info(f"Reused cached extraction {cache_path} for {output_path}")
+            console.print("[green]Reused cached extraction for unchanged inputs.[/green]")
+    if not reused:
+        from rich.status import Status
+
+        # The spinner repaints from a background thread; only run it when someone
+        # is watching a terminal
+        if console.is_terminal and os.environ.get(NO_SPINNER_ENV, "0") in ("", "0"):
+            status_display = Status(
+                _STATUS_MSG,
+                console=console,
+                spinner="dots",
+                refresh_per_second=4,
+            )
+        else:
+            console.print("[yellow]Extracting shoreline...[/yellow]")
+            status_display = nullcontext()
+        sys.stdout.flush()
+        try:
+            with status_display as status:
+                extracted = run_with_status(
+                    status,
+                    extract_shoreline,
+                    b8_path_obj,
+                    aoi_path_obj,
+                    output_path_obj,
+                    args.min_sea_area_m2,
+                    args.min_island_area_m2,
+                )
+        except KeyboardInterrupt:
+            console.print("[red]Extraction interrupted.[/red]")
+            sys.exit(130)
+        if not extracted:
+            console.print(
+                "[bold red]Shoreline extraction failed.[/bold red] See the log for details."
+            )
+            sys.stdout.flush()
+            sys.exit(1)
+        if cache_path is not None:
+            store_cached_extraction(output_path, cache_path)
+    with console:
+        if console.is_terminal:
+            console.print(_RULE_COMPLETE)
+        console.print(f"[green]Shoreline extracted successfully to:[/green] {output_path}")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()